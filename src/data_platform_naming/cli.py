@@ -6,9 +6,10 @@ Unified interface for blueprint planning and CRUD operations
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import os
-import re
 import sys
 from pathlib import Path
 from typing import Any
@@ -30,7 +31,11 @@ from data_platform_naming.crud.transaction_manager import (
     OperationType,
     TransactionManager,
 )
-from data_platform_naming.dbx_naming import DatabricksNamingConfig, DatabricksNamingGenerator
+from data_platform_naming.dbx_naming import (
+    PROJECT_NAME_PATTERN,
+    DatabricksNamingConfig,
+    DatabricksNamingGenerator,
+)
 from data_platform_naming.plan.blueprint import BLUEPRINT_SCHEMA, BlueprintParser
 
 console = Console()
@@ -41,13 +46,13 @@ console = Console()
 # =============================================================================
 
 # Allowed override keys for CLI --override parameter
-ALLOWED_OVERRIDE_KEYS = {
+ALLOWED_OVERRIDE_KEYS = frozenset({
     'environment', 'project', 'region', 'team',
     'cost_center', 'data_classification'
-}
+})
 
 # Valid environment values
-ENVIRONMENT_VALUES = {e.value for e in Environment}
+ENVIRONMENT_VALUES = frozenset(e.value for e in Environment)
 
 
 # =============================================================================
@@ -145,7 +150,7 @@ def load_configuration_manager(
 
             # Validate project name format
             if key == 'project':
-                if not re.match(r'^[a-z0-9-]+$', value):
+                if not PROJECT_NAME_PATTERN.match(value):
                     raise click.ClickException(
                         f"Invalid project name: '{value}'\n"
                         "Use lowercase letters, numbers, and hyphens only"
@@ -161,6 +166,33 @@ def load_configuration_manager(
     return manager
 
 
+def _examples_dir() -> Path:
+    """
+    Return the directory holding the example naming configs used by 'config init'.
+
+    The DPN_EXAMPLES_DIR environment variable takes precedence over the
+    examples/configs directory of the source checkout.
+    """
+    env_dir = os.environ.get('DPN_EXAMPLES_DIR')
+    if env_dir:
+        return Path(env_dir)
+    return Path(__file__).parent.parent.parent / 'examples' / 'configs'
+
+
+@functools.lru_cache(maxsize=8)
+def _load_example_yaml(path_str: str, mtime_ns: int) -> Any:
+    """
+    Parse an example config file, cached per (path, mtime).
+
+    Repeated 'config init' runs against unchanged example files reuse the
+    parsed document. Callers must copy the result before mutating it.
+    """
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(Path(path_str).read_bytes(), Loader=loader)
+
+
 @click.group()
 @click.version_option(version='0.1.0')
 def cli() -> None:
@@ -785,9 +817,11 @@ def _parse_resource_type_selection(selection: str, available_types: list[str]) -
 @click.option('--resource-types', default=None,
               help='Resource type selection (e.g., "1,3,5", "1-5", or "all")')
 @click.option('--force', is_flag=True, help='Overwrite existing files without prompting')
+@click.option('--config-dir', 'base_dir', type=click.Path(file_okay=False), default=None,
+              help='Directory in which to create .dpn/ (default: current directory)')
 def config_init(cost_center: str | None, environment: str | None,
                 project: str | None, region: str | None, team: str | None,
-                resource_types: str | None, force: bool) -> None:
+                resource_types: str | None, force: bool, base_dir: str | None) -> None:
     """Initialize configuration with interactive prompts (default) or flags
 
     Interactive mode (prompts for all values):
@@ -807,6 +841,9 @@ def config_init(cost_center: str | None, environment: str | None,
       # Fully automated
       dpn config init --project analytics --environment dev --region us-west-2 \\
         --team data-platform --cost-center engineering --resource-types "1,3-5" --force
+
+      # Write .dpn/ under another directory
+      dpn config init --config-dir ./my-project
     """
 
     import shutil
@@ -814,8 +851,8 @@ def config_init(cost_center: str | None, environment: str | None,
     import yaml
 
     try:
-        # Create .dpn directory in current working directory
-        config_dir = Path.cwd() / '.dpn'
+        # Create .dpn directory in --config-dir or the current working directory
+        config_dir = (Path(base_dir) if base_dir else Path.cwd()) / '.dpn'
         config_dir.mkdir(parents=True, exist_ok=True)
 
         # Define target paths
@@ -823,11 +860,14 @@ def config_init(cost_center: str | None, environment: str | None,
         patterns_path = config_dir / 'naming-patterns.yaml'
 
         # Get example directory
-        example_dir = Path(__file__).parent.parent.parent / 'examples' / 'configs'
+        example_dir = _examples_dir()
 
         if not example_dir.exists():
             console.print(f"[red]Error:[/red] Example configs not found at {example_dir}")
-            console.print("[yellow]Hint:[/yellow] Run from project root or install package properly")
+            console.print(
+                "[yellow]Hint:[/yellow] Run from project root, install package properly, "
+                "or set DPN_EXAMPLES_DIR"
+            )
             sys.exit(1)
 
         # Load available resource types from example patterns file
@@ -836,8 +876,9 @@ def config_init(cost_center: str | None, environment: str | None,
             console.print("[red]Error:[/red] Example naming-patterns.yaml not found")
             sys.exit(1)
 
-        with open(example_patterns) as f:
-            patterns_data = yaml.safe_load(f)
+        patterns_data = _load_example_yaml(
+            str(example_patterns), example_patterns.stat().st_mtime_ns
+        )
 
         available_types = list(patterns_data.get('patterns', {}).keys())
 
@@ -905,8 +946,9 @@ def config_init(cost_center: str | None, environment: str | None,
             console.print("[red]Error:[/red] Example naming-values.yaml not found")
             sys.exit(1)
 
-        with open(example_values) as f:
-            values_data = yaml.safe_load(f)
+        values_data = copy.deepcopy(
+            _load_example_yaml(str(example_values), example_values.stat().st_mtime_ns)
+        )
 
         # Customize with prompted/provided values
         if 'defaults' in values_data:
@@ -921,7 +963,11 @@ def config_init(cost_center: str | None, environment: str | None,
 
         # Write naming-values.yaml
         with open(values_path, 'w') as f:
-            yaml.dump(values_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                values_data, f,
+                Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                default_flow_style=False, sort_keys=False
+            )
 
         console.print(f"\n[green]✓[/green] Created: {values_path}")
 
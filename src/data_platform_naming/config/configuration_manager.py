@@ -8,7 +8,13 @@ by coordinating between NamingValuesLoader and NamingPatternsLoader.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +34,7 @@ from data_platform_naming.validators import (
 )
 
 from .naming_patterns_loader import (
+    NamingPattern,
     NamingPatternsLoader,
     PatternError,
 )
@@ -36,8 +43,52 @@ from .naming_values_loader import (
     NamingValuesLoader,
 )
 
+# Inputs of the region_mapping transformation (region -> region_short)
+_REGION_KEYS = frozenset({"region", "region_short"})
 
-@dataclass
+
+def _freeze(
+    mapping: Mapping[str, object] | None
+) -> tuple[tuple[str, type, Any], ...] | None:
+    """
+    Hashable, order-independent form of an optional mapping (cache key part).
+
+    Each value is keyed with its type, since equal values such as 1, 1.0 and
+    True hash alike but may render differently.
+    """
+    if not mapping:
+        return None
+    return tuple((key, type(value), value) for key, value in sorted(mapping.items()))
+
+
+def _load_source_key(path: Path | None, config: dict[str, Any] | None) -> bytes | None:
+    """
+    Digest identifying one load_configs input, or None if it cannot be keyed.
+
+    A file is identified by its path, mtime and size (as in the loaders' parse
+    cache), a dict by its canonical JSON, so equal contents match even when the
+    dict was rebuilt.
+    """
+    try:
+        if path:
+            stat = Path(path).stat()
+            source = f"path:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        elif config:
+            source = "dict:" + json.dumps(config, sort_keys=True, separators=(",", ":"))
+        else:
+            return None
+    except (OSError, TypeError, ValueError):
+        # Missing files and non-JSON values are left to the loaders to report
+        return None
+    return hashlib.blake2b(source.encode(), digest_size=16).digest()
+
+
+def _thaw(frozen: tuple[tuple[str, type, Any], ...] | None) -> dict[str, Any] | None:
+    """Rebuild the mapping frozen by _freeze"""
+    return {key: value for key, _, value in frozen} if frozen else None
+
+
+@dataclass(slots=True, frozen=True)
 class GeneratedName:
     """Container for a generated resource name with metadata"""
     name: str
@@ -45,11 +96,22 @@ class GeneratedName:
     pattern_used: str
     values_used: dict[str, Any]
     validation_errors: list[str]
+    # Whether the name is valid (no validation errors); derived once at construction
+    is_valid: bool = field(init=False)
 
-    @property
-    def is_valid(self) -> bool:
-        """Check if name is valid (no validation errors)"""
-        return len(self.validation_errors) == 0
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_valid", not self.validation_errors)
+
+
+def _error_name(resource_type: str, error: Exception) -> GeneratedName:
+    """Placeholder result for a resource whose name could not be generated"""
+    return GeneratedName(
+        name="",
+        resource_type=resource_type,
+        pattern_used="",
+        values_used={},
+        validation_errors=[str(error)]
+    )
 
 
 class ConfigurationManager:
@@ -76,6 +138,20 @@ class ConfigurationManager:
         'dataplatform-raw-raw-prd-use1'
     """
 
+    __slots__ = (
+        "values_loader",
+        "patterns_loader",
+        "_cli_overrides",
+        "_generate_name_cached",
+        "_base_values",
+        "_transformed_base_values",
+        "_repr_cache",
+        "_loader_generations",
+        "_last_load",
+        "_values_loaded",
+        "_patterns_loaded",
+    )
+
     def __init__(
         self,
         values_loader: NamingValuesLoader | None = None,
@@ -91,6 +167,19 @@ class ConfigurationManager:
         self.values_loader = values_loader or NamingValuesLoader()
         self.patterns_loader = patterns_loader or NamingPatternsLoader()
         self._cli_overrides: dict[str, str] = {}
+        # Per-instance memo of generated names; cleared whenever configs are reloaded
+        self._generate_name_cached = functools.lru_cache(maxsize=1024)(
+            self._generate_name_from_keys
+        )
+        # defaults < environments.{env} < resource_types.{type}, merged on first use per load
+        self._base_values: dict[tuple[str | None, str], dict[str, Any]] = {}
+        self._transformed_base_values: dict[tuple[str | None, str], dict[str, Any]] = {}
+        # repr() of the loaded state, built on first use after each load
+        self._repr_cache: str | None = None
+        # Loader generations the cached state above was derived from
+        self._loader_generations = self._current_loader_generations()
+        # Input digests and loader generations of the last successful load_configs
+        self._last_load: tuple[tuple[bytes | None, bytes | None], tuple[int, int]] | None = None
 
         # Detect if loaders already have data loaded
         self._values_loaded = self._check_values_loader_has_data()
@@ -117,29 +206,98 @@ class ConfigurationManager:
             FileLoadError: If files cannot be loaded
             SchemaValidationError: If configurations don't validate
         """
-        # Load values
-        if values_path:
-            self.values_loader.load_from_file(values_path)
-        elif values_dict:
-            self.values_loader.load_from_dict(values_dict)
-        else:
-            raise ConfigurationError(
-                "Must provide either values_path or values_dict"
-            )
+        load_key = (
+            _load_source_key(values_path, values_dict),
+            _load_source_key(patterns_path, patterns_dict)
+        )
+        # Same inputs as the last load and neither loader reloaded directly since:
+        # the loaded configs and everything derived from them are still current
+        if None not in load_key and self._last_load == (
+            load_key, self._current_loader_generations()
+        ):
+            return
+        self._last_load = None
 
-        # Load patterns
-        if patterns_path:
-            self.patterns_loader.load_from_file(patterns_path)
-        elif patterns_dict:
-            self.patterns_loader.load_from_dict(patterns_dict)
-        else:
-            raise ConfigurationError(
-                "Must provide either patterns_path or patterns_dict"
-            )
+        try:
+            # Load values
+            if values_path:
+                self.values_loader.load_from_file(values_path)
+            elif values_dict:
+                self.values_loader.load_from_dict(values_dict)
+            else:
+                raise ConfigurationError(
+                    "Must provide either values_path or values_dict"
+                )
+
+            # Load patterns
+            if patterns_path:
+                self.patterns_loader.load_from_file(patterns_path)
+            elif patterns_dict:
+                self.patterns_loader.load_from_dict(patterns_dict)
+            else:
+                raise ConfigurationError(
+                    "Must provide either patterns_path or patterns_dict"
+                )
+        finally:
+            # Even a failed load may have replaced one loader's config
+            self._invalidate_caches()
 
         # Update flags after successful loading
         self._values_loaded = self._check_values_loader_has_data()
         self._patterns_loaded = self._check_patterns_loader_has_data()
+        self._last_load = (load_key, self._current_loader_generations())
+
+    def _current_loader_generations(self) -> tuple[int, int]:
+        """Load counters of both loaders"""
+        return (self.values_loader._generation, self.patterns_loader._generation)
+
+    def _invalidate_caches(self) -> None:
+        """Drop all state derived from the loaders' current configs"""
+        self._generate_name_cached.cache_clear()
+        self._repr_cache = None
+        self._base_values.clear()
+        self._transformed_base_values.clear()
+        self._loader_generations = self._current_loader_generations()
+
+    def _sync_caches(self) -> None:
+        """Invalidate derived state if either loader was reloaded since it was built"""
+        if self._loader_generations != self._current_loader_generations():
+            self._invalidate_caches()
+
+    def _get_base_values(
+        self,
+        environment: str | None,
+        resource_type: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Get merged config values for a pair, raw and transformed.
+
+        Pairs are merged on first use and kept until either loader is reloaded
+        (see _sync_caches), so only the resource types a caller actually names
+        pay the merge cost.
+        """
+        key = (environment, resource_type)
+        base_values = self._base_values.get(key)
+        if base_values is not None:
+            return base_values, self._transformed_base_values[key]
+
+        # Interned variable names match the interned pattern variables by identity
+        base_values = {
+            sys.intern(name): value
+            for name, value in self.values_loader.get_values_for_resource(
+                resource_type=resource_type,
+                environment=environment
+            ).values.items()
+        }
+        transformed_values = self.patterns_loader.apply_transformations(base_values)
+
+        # Only configured pairs are kept, so arbitrary inputs can't grow the cache
+        if resource_type in self.patterns_loader._pattern_variables and (
+            environment is None or environment in self.values_loader.list_environments()
+        ):
+            self._base_values[key] = base_values
+            self._transformed_base_values[key] = transformed_values
+        return base_values, transformed_values
 
     def load_from_default_locations(self, base_dir: Path | None = None) -> bool:
         """
@@ -205,26 +363,75 @@ class ConfigurationManager:
             PatternError: If pattern not found or variables missing
         """
         self._check_loaded()
+        self._sync_caches()
 
-        # Get merged values
-        values = self.values_loader.get_values_for_resource(
-            resource_type=resource_type,
-            environment=environment,
-            blueprint_metadata=blueprint_metadata
-        )
+        key = (resource_type, environment, _freeze(blueprint_metadata), _freeze(value_overrides))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable metadata/override values can't be memoized
+            return self._generate_name(
+                resource_type, environment, blueprint_metadata, value_overrides
+            )
 
-        # Apply any additional overrides
-        merged_values = dict(values.values)
-        if value_overrides:
-            merged_values.update(value_overrides)
+        cached = self._generate_name_cached(*key)
+        # Fresh containers so callers can't mutate the memoized result
+        return replace(
+            cached,
+            values_used=dict(cached.values_used),
+            validation_errors=list(cached.validation_errors)
+        )
 
-        # Apply transformations
-        transformed_values = self.patterns_loader.apply_transformations(
-            merged_values
+    def _generate_name_from_keys(
+        self,
+        resource_type: str,
+        environment: str | None,
+        metadata_key: tuple[tuple[str, type, Any], ...] | None,
+        overrides_key: tuple[tuple[str, type, Any], ...] | None
+    ) -> GeneratedName:
+        """Memoized entry point: rebuild the mappings from their cache keys"""
+        return self._generate_name(
+            resource_type,
+            environment,
+            _thaw(metadata_key),  # type: ignore[arg-type]
+            _thaw(overrides_key)  # type: ignore[arg-type]
         )
 
-        # Get pattern
-        pattern = self.patterns_loader.get_pattern(resource_type)
+    def _generate_name(
+        self,
+        resource_type: str,
+        environment: str | None,
+        blueprint_metadata: MetadataDict | None,
+        value_overrides: ValueOverridesDict | None,
+        pattern: NamingPattern | None = None
+    ) -> GeneratedName:
+        """Generate a name without consulting the memo (see generate_name)"""
+        # Blueprint metadata, then any additional overrides
+        extra_values: dict[str, Any] = {}
+        if blueprint_metadata:
+            extra_values.update(blueprint_metadata)
+        if value_overrides:
+            extra_values.update(value_overrides)
+
+        base_values, transformed_base_values = self._get_base_values(environment, resource_type)
+
+        # Base values are already transformed; only re-transform what changed
+        transformed_values = dict(transformed_base_values)
+        if extra_values:
+            merged_values = {**base_values, **extra_values}
+            retransform = extra_values.keys()
+            if retransform & _REGION_KEYS:
+                # region_short is derived from region by region_mapping; drop the
+                # base's derived value so an unmapped region can't keep it
+                retransform = retransform | _REGION_KEYS
+                transformed_values.pop("region_short", None)
+            transformed_values.update(self.patterns_loader.apply_transformations({
+                k: merged_values[k] for k in retransform if k in merged_values
+            }))
+
+        # Get pattern, unless the caller already resolved it
+        if pattern is None:
+            pattern = self.patterns_loader.get_pattern(resource_type)
 
         # Format pattern with values
         name = pattern.format(transformed_values)
@@ -317,34 +524,47 @@ class ConfigurationManager:
             ConfigurationError: If configs not loaded
         """
         self._check_loaded()
+        self._sync_caches()
 
-        results: dict[str, GeneratedName] = {}
-        for resource in resources:
-            # Ensure resource_id is always a string
-            resource_id = str(resource.get("id") or resource.get("type") or "unknown")
-            resource_type = resource["type"]
-
-            # Merge blueprint metadata with resource metadata
-            resource_metadata: dict[str, Any] = dict(blueprint_metadata or {})
-            if "metadata" in resource:
-                resource_metadata.update(resource["metadata"])
+        # Group resources by type so each pattern is resolved once per blueprint
+        groups: dict[str, list[int]] = defaultdict(list)
+        for index, resource in enumerate(resources):
+            groups[resource["type"]].append(index)
 
+        generated: list[GeneratedName] = [None] * len(resources)  # type: ignore[list-item]
+        for resource_type, indices in groups.items():
             try:
-                result = self.generate_name(
-                    resource_type=resource_type,
-                    environment=environment,
-                    blueprint_metadata=resource_metadata if resource_metadata else None  # type: ignore[arg-type]
-                )
-                results[resource_id] = result
+                pattern = self.patterns_loader.get_pattern(resource_type)
             except (PatternError, ConfigurationError) as e:
                 # Store error as validation error
-                results[resource_id] = GeneratedName(
-                    name="",
-                    resource_type=resource_type,
-                    pattern_used="",
-                    values_used={},
-                    validation_errors=[str(e)]
-                )
+                for index in indices:
+                    generated[index] = _error_name(resource_type, e)
+                continue
+
+            for index in indices:
+                resource = resources[index]
+
+                # Merge blueprint metadata with resource metadata
+                resource_metadata: dict[str, Any] = dict(blueprint_metadata or {})
+                if "metadata" in resource:
+                    resource_metadata.update(resource["metadata"])
+
+                try:
+                    generated[index] = self._generate_name(
+                        resource_type,
+                        environment,
+                        resource_metadata if resource_metadata else None,  # type: ignore[arg-type]
+                        None,
+                        pattern=pattern
+                    )
+                except (PatternError, ConfigurationError) as e:
+                    generated[index] = _error_name(resource_type, e)
+
+        results: dict[str, GeneratedName] = {}
+        for resource, result in zip(resources, generated):
+            # Ensure resource_id is always a string
+            resource_id = str(resource.get("id") or resource.get("type") or "unknown")
+            results[resource_id] = result
 
         return results
 
@@ -362,14 +582,19 @@ class ConfigurationManager:
         """
         self._check_loaded()
 
-        warnings = []
-
-        # Get all patterns
-        patterns = self.patterns_loader.get_all_patterns()
+        warnings: list[str] = []
 
         # Get default values to check against
         defaults = self.values_loader.get_defaults()
 
+        # One set comparison settles the common case: defaults cover every
+        # variable any pattern uses or requires, so nothing can be missing
+        if defaults.keys() >= self.patterns_loader._referenced_variables:
+            return warnings
+
+        # Get all patterns
+        patterns = self.patterns_loader.get_all_patterns()
+
         # Check each pattern
         for resource_type, pattern in patterns.items():
             pattern_vars = pattern.get_variables()
@@ -386,13 +611,12 @@ class ConfigurationManager:
 
             # Check for variables in pattern but not marked as required
             unmarked_vars = pattern_vars - required_vars
-            if unmarked_vars and not defaults.keys() >= unmarked_vars:
-                missing = unmarked_vars - set(defaults.keys())
-                if missing:
-                    warnings.append(
-                        f"{resource_type}: Pattern uses variables not in defaults "
-                        f"or required list: {', '.join(sorted(missing))}"
-                    )
+            missing = unmarked_vars - defaults.keys()
+            if missing:
+                warnings.append(
+                    f"{resource_type}: Pattern uses variables not in defaults "
+                    f"or required list: {', '.join(sorted(missing))}"
+                )
 
         return warnings
 
@@ -495,19 +719,23 @@ class ConfigurationManager:
         """String representation of manager"""
         if not self.is_loaded:
             return "ConfigurationManager(not loaded)"
+        self._sync_caches()
+        if self._repr_cache is not None:
+            return self._repr_cache
 
         values_version = self.values_loader.get_version()
         patterns_version = self.patterns_loader.get_version()
         resource_type_count = len(self.get_available_resource_types())
         environment_count = len(self.get_available_environments())
 
-        return (
+        self._repr_cache = (
             f"ConfigurationManager("
             f"values_version={values_version}, "
             f"patterns_version={patterns_version}, "
             f"resource_types={resource_type_count}, "
             f"environments={environment_count})"
         )
+        return self._repr_cache
 
 
 # Example usage
@@ -11,13 +11,12 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, cast
 
-import jsonschema
 import yaml
-from jsonschema import ValidationError as JsonSchemaValidationError
 
 from data_platform_naming.types import (
     ConfigValuesDict,
@@ -28,8 +27,14 @@ from .naming_values_loader import (
     ConfigurationError,
     FileLoadError,
     SchemaValidationError,
+    _load_json_file,
+    _load_yaml_file,
+    _validate_against_schema,
 )
 
+# {variable} placeholder in a naming pattern, compiled once at import
+PLACEHOLDER_PATTERN = re.compile(r'\{([a-z_]+)\}')
+
 
 class PatternError(ConfigurationError):
     """Raised when pattern is invalid or cannot be resolved"""
@@ -42,10 +47,16 @@ class NamingPattern:
     pattern: str
     resource_type: str
     required_variables: list[str]
+    # Placeholder names in order of appearance; extracted from pattern if not given
+    variables: tuple[str, ...] | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.variables is None:
+            self.variables = tuple(PLACEHOLDER_PATTERN.findall(self.pattern))
 
     def get_variables(self) -> set[str]:
         """Extract all {variable} placeholders from pattern"""
-        return set(re.findall(r'\{([a-z_]+)\}', self.pattern))
+        return set(self.variables or ())
 
     def validate_variables(self, available_variables: ConfigValuesDict | dict[str, Any]) -> list[str]:
         """
@@ -75,15 +86,28 @@ class NamingPattern:
         Raises:
             PatternError: If required variables are missing
         """
-        missing = self.validate_variables(values)
-        if missing:
-            raise PatternError(
-                f"Missing required variables for pattern '{self.pattern}': {', '.join(missing)}"
-            )
-
+        # Substitute first and only work out which variables are missing when
+        # substitution fails, so the common case is a single pass
+        variables = self.variables or ()
         try:
-            return self.pattern.format(**values)
+            # Fast path for constant and single-placeholder patterns (e.g. '{entity}'):
+            # skip the format mini-language parser when there are no other braces
+            if len(variables) <= 1 and (
+                self.pattern.count("{") == self.pattern.count("}") == len(variables)
+            ):
+                if not variables:
+                    return self.pattern
+                # format(), not str(), so values render exactly as format_map renders them
+                return self.pattern.replace(f"{{{variables[0]}}}", format(values[variables[0]]))
+
+            return self.pattern.format_map(values)
         except KeyError as e:
+            missing = self.validate_variables(values)
+            if missing:
+                raise PatternError(
+                    f"Missing required variables for pattern '{self.pattern}': "
+                    f"{', '.join(missing)}"
+                ) from None
             raise PatternError(f"Variable substitution failed: {e}") from e
 
 
@@ -116,6 +140,16 @@ class NamingPatternsLoader:
         self.config: dict[str, Any] | None = None
         self.schema: dict[str, Any] = self._load_schema(schema_path)
         self.config_path: Path | None = None
+        # Bumped on every successful load so dependents know derived state is stale
+        self._generation = 0
+        # Placeholder names per resource type, extracted once per load
+        self._pattern_variables: dict[str, tuple[str, ...]] = {}
+        # Every variable used by any pattern or listed as required by any rule
+        self._referenced_variables: frozenset[str] = frozenset()
+        # Validation rules per resource type, prepared once per load
+        self._required_variables: dict[str, tuple[str, ...]] = {}
+        self._max_lengths: dict[str, int] = {}
+        self._allowed_chars_re: dict[str, re.Pattern[str]] = {}
 
     def _load_schema(self, schema_path: Path | None = None) -> dict[str, Any]:
         """Load the JSON schema for validation"""
@@ -124,9 +158,10 @@ class NamingPatternsLoader:
             module_dir = Path(__file__).parent.parent.parent.parent
             schema_path = module_dir / "schemas" / "naming-patterns-schema.json"
 
+        # Validators are cached per schema file
+        self._schema_key = str(schema_path)
         try:
-            with open(schema_path) as f:
-                return cast(dict[str, Any], json.load(f))
+            return cast(dict[str, Any], _load_json_file(Path(schema_path)))
         except FileNotFoundError:
             raise ConfigurationError(
                 f"Schema file not found: {schema_path}"
@@ -149,14 +184,12 @@ class NamingPatternsLoader:
         """
         config_path = Path(config_path)
 
-        if not config_path.exists():
+        try:
+            config = _load_yaml_file(config_path)
+        except FileNotFoundError:
             raise FileLoadError(
                 f"Configuration file not found: {config_path}"
-            )
-
-        try:
-            with open(config_path) as f:
-                self.config = yaml.safe_load(f)
+            ) from None
         except yaml.YAMLError as e:
             raise FileLoadError(
                 f"Invalid YAML in configuration file: {e}"
@@ -166,8 +199,7 @@ class NamingPatternsLoader:
                 f"Failed to read configuration file: {e}"
             ) from e
 
-        self.config_path = config_path
-        self._validate_config()
+        self._apply_config(config, config_path)
 
     def load_from_dict(self, config: dict[str, Any]) -> None:
         """
@@ -179,22 +211,38 @@ class NamingPatternsLoader:
         Raises:
             SchemaValidationError: If configuration doesn't validate
         """
+        self._apply_config(config, None)
+
+    def _apply_config(self, config: dict[str, Any], config_path: Path | None) -> None:
+        """
+        Validate and index a configuration, then make it the loaded one.
+
+        Nothing is assigned until validation and indexing succeed, so a failed
+        load leaves the previous configuration and its indexes in place.
+
+        Raises:
+            SchemaValidationError: If validation fails
+        """
+        self._validate_config(config)
+        self._index_patterns(config)
         self.config = config
-        self.config_path = None
-        self._validate_config()
+        self.config_path = config_path
+        self._generation += 1
 
-    def _validate_config(self) -> None:
+    def _validate_config(self, config: dict[str, Any] | None) -> None:
         """
         Validate configuration against JSON schema.
 
         Raises:
             SchemaValidationError: If validation fails
         """
-        if self.config is None:
+        if config is None:
             raise ConfigurationError("No configuration loaded")
 
+        from jsonschema import ValidationError as JsonSchemaValidationError
+
         try:
-            jsonschema.validate(instance=self.config, schema=self.schema)
+            _validate_against_schema(config, self.schema, self._schema_key)
         except JsonSchemaValidationError as e:
             # Provide helpful error message
             error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
@@ -202,6 +250,39 @@ class NamingPatternsLoader:
                 f"Configuration validation failed at {error_path}: {e.message}"
             ) from e
 
+    def _index_patterns(self, config: dict[str, Any]) -> None:
+        """Extract placeholder names and compile validation rules of a config"""
+        # Interned names make the dict lookups on them pointer comparisons
+        pattern_variables = {
+            sys.intern(resource_type): tuple(
+                map(sys.intern, PLACEHOLDER_PATTERN.findall(pattern_str))
+            )
+            for resource_type, pattern_str in config.get("patterns", {}).items()
+        }
+
+        validation = config.get("validation", {})
+        required_variables = {
+            resource_type: tuple(variables)
+            for resource_type, variables in validation.get("required_variables", {}).items()
+        }
+        max_lengths = {
+            resource_type: int(max_length)
+            for resource_type, max_length in validation.get("max_length", {}).items()
+        }
+        allowed_chars_re = {
+            resource_type: re.compile(str(regex))
+            for resource_type, regex in validation.get("allowed_chars", {}).items()
+        }
+
+        # Assigned together so a rule that fails to compile leaves the old indexes whole
+        self._pattern_variables = pattern_variables
+        self._required_variables = required_variables
+        self._referenced_variables = frozenset().union(
+            *pattern_variables.values(), *required_variables.values()
+        )
+        self._max_lengths = max_lengths
+        self._allowed_chars_re = allowed_chars_re
+
     def get_pattern(self, resource_type: str) -> NamingPattern:
         """
         Get naming pattern for a specific resource type.
@@ -230,7 +311,8 @@ class NamingPatternsLoader:
         return NamingPattern(
             pattern=pattern_str,
             resource_type=resource_type,
-            required_variables=required_vars
+            required_variables=required_vars,
+            variables=self._pattern_variables.get(resource_type)
         )
 
     def get_all_patterns(self) -> dict[str, NamingPattern]:
@@ -387,9 +469,7 @@ class NamingPatternsLoader:
         if self.config is None:
             raise ConfigurationError("No configuration loaded")
 
-        validation = self.config.get("validation", {})
-        required_vars = validation.get("required_variables", {})
-        return cast(list[str], required_vars.get(resource_type, []))
+        return list(self._required_variables.get(resource_type, ()))
 
     def validate_name(self, resource_type: str, name: str) -> list[str]:
         """
@@ -402,20 +482,23 @@ class NamingPatternsLoader:
         Returns:
             List of validation errors (empty if valid)
         """
+        if self.config is None:
+            raise ConfigurationError("No configuration loaded")
+
         errors = []
 
         # Check max length
-        max_length = self.get_max_length(resource_type)
+        max_length = self._max_lengths.get(resource_type)
         if max_length and len(name) > max_length:
             errors.append(
                 f"Name exceeds maximum length of {max_length}: {len(name)} characters"
             )
 
         # Check allowed characters
-        allowed_pattern = self.get_allowed_chars_pattern(resource_type)
-        if allowed_pattern and not re.match(allowed_pattern, name):
+        allowed_re = self._allowed_chars_re.get(resource_type)
+        if allowed_re and not allowed_re.match(name):
             errors.append(
-                f"Name contains invalid characters (pattern: {allowed_pattern})"
+                f"Name contains invalid characters (pattern: {allowed_re.pattern})"
             )
 
         return errors
@@ -8,19 +8,30 @@ validate them against JSON Schema, and merge values according to precedence rule
 
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
-import jsonschema
 import yaml
-from jsonschema import ValidationError as JsonSchemaValidationError
 
 from data_platform_naming.types import (
     MetadataDict,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Parsed config files by path, reused while (mtime_ns, size) is unchanged
+_YAML_CACHE: dict[str, tuple[int, int, Any]] = {}
+_JSON_CACHE: dict[str, tuple[int, int, Any]] = {}
+
+# Checked schema validators, keyed by schema file path
+_VALIDATOR_CACHE: dict[str, Any] = {}
+
 
 class ConfigurationError(Exception):
     """Base exception for configuration errors"""
@@ -42,6 +53,79 @@ class ValueResolutionError(ConfigurationError):
     pass
 
 
+def _load_yaml_file(config_path: Path) -> Any:
+    """
+    Parse a YAML config file, reusing the previous parse if it is unchanged.
+
+    Each caller gets its own deep copy, so mutating it never reaches the cache.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = config_path.stat()
+    key = str(config_path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+
+    data = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """
+    Parse a JSON file (e.g. a schema), reusing the previous parse if it is unchanged.
+
+    The returned object is shared between callers and must be treated as
+    read-only; schemas are only ever read, and copying one costs more than
+    parsing it again.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    stat = file_path.stat()
+    key = str(file_path)
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    data = json.loads(file_path.read_bytes())
+    _JSON_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def _validate_against_schema(
+    instance: Any, schema: dict[str, Any], schema_key: str
+) -> None:
+    """
+    Validate an instance like jsonschema.validate, reusing the validator per schema file.
+
+    jsonschema.validate checks the schema against its metaschema on every call;
+    here that happens once per parse of the schema file at schema_key.
+
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    # jsonschema is only needed once a config is loaded; keep it off the import path
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+
+    validator = _VALIDATOR_CACHE.get(schema_key)
+    # An edited schema file is parsed into a new object, which needs a new validator
+    if validator is None or validator.schema is not schema:
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = _VALIDATOR_CACHE[schema_key] = validator_class(schema)
+
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
 @dataclass
 class NamingValues:
     """Container for resolved naming values"""
@@ -97,6 +181,8 @@ class NamingValuesLoader:
         self.config: dict[str, Any] | None = None
         self.schema: dict[str, Any] = self._load_schema(schema_path)
         self.config_path: Path | None = None
+        # Bumped on every load so dependents can tell their derived state is stale
+        self._generation = 0
 
     def _load_schema(self, schema_path: Path | None = None) -> dict[str, Any]:
         """Load the JSON schema for validation"""
@@ -105,9 +191,10 @@ class NamingValuesLoader:
             module_dir = Path(__file__).parent.parent.parent.parent
             schema_path = module_dir / "schemas" / "naming-values-schema.json"
 
+        # Validators are cached per schema file
+        self._schema_key = str(schema_path)
         try:
-            with open(schema_path) as f:
-                return cast(dict[str, Any], json.load(f))
+            return cast(dict[str, Any], _load_json_file(Path(schema_path)))
         except FileNotFoundError:
             raise ConfigurationError(
                 f"Schema file not found: {schema_path}"
@@ -129,15 +216,14 @@ class NamingValuesLoader:
             SchemaValidationError: If configuration doesn't validate
         """
         config_path = Path(config_path)
+        self._generation += 1
 
-        if not config_path.exists():
+        try:
+            self.config = _load_yaml_file(config_path)
+        except FileNotFoundError:
             raise FileLoadError(
                 f"Configuration file not found: {config_path}"
-            )
-
-        try:
-            with open(config_path) as f:
-                self.config = yaml.safe_load(f)
+            ) from None
         except yaml.YAMLError as e:
             raise FileLoadError(
                 f"Invalid YAML in configuration file: {e}"
@@ -160,6 +246,7 @@ class NamingValuesLoader:
         Raises:
             SchemaValidationError: If configuration doesn't validate
         """
+        self._generation += 1
         self.config = config
         self.config_path = None
         self._validate_config()
@@ -174,8 +261,10 @@ class NamingValuesLoader:
         if self.config is None:
             raise ConfigurationError("No configuration loaded")
 
+        from jsonschema import ValidationError as JsonSchemaValidationError
+
         try:
-            jsonschema.validate(instance=self.config, schema=self.schema)
+            _validate_against_schema(self.config, self.schema, self._schema_key)
         except JsonSchemaValidationError as e:
             # Provide helpful error message
             error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
@@ -24,8 +24,13 @@ from .constants import (
 from .exceptions import ConfigurationError, PatternError, ValidationError
 from .types import MetadataDict, ValueOverridesDict
 
+# Config checks run on every generator construction; build them once at import
+# (cli.py checks --override project=... against the same PROJECT_NAME_PATTERN)
+PROJECT_NAME_PATTERN = re.compile(r'^[a-z0-9-]+$')
+_ENVIRONMENTS = frozenset(e.value for e in Environment)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DatabricksNamingConfig:
     """Configuration for Databricks naming conventions"""
     environment: str  # dev, stg, prd
@@ -39,6 +44,8 @@ class DatabricksNamingConfig:
 class DatabricksNamingGenerator:
     """Generate standardized names for Databricks resources"""
 
+    __slots__ = ("config", "configuration_manager", "_standard_tags")
+
     # Maximum lengths for different resource types
     MAX_LENGTHS = {
         DatabricksResourceType.WORKSPACE: 64,
@@ -88,12 +95,14 @@ class DatabricksNamingGenerator:
 
         self.config = config
         self.configuration_manager = configuration_manager
+        # Standard tags per resource type; the config is fixed once validated
+        self._standard_tags: dict[DatabricksResourceType, dict[str, str]] = {}
 
         self._validate_config()
 
     def _validate_config(self) -> None:
         """Validate configuration parameters"""
-        if self.config.environment not in [e.value for e in Environment]:
+        if self.config.environment not in _ENVIRONMENTS:
             raise ValidationError(
                 message=f"Invalid environment: {self.config.environment}",
                 field="environment",
@@ -101,7 +110,7 @@ class DatabricksNamingGenerator:
                 suggestion="Must be one of: dev, stg, prd"
             )
 
-        if not re.match(r'^[a-z0-9-]+$', self.config.project):
+        if not PROJECT_NAME_PATTERN.match(self.config.project):
             raise ValidationError(
                 message=f"Invalid project name: {self.config.project}",
                 field="project",
@@ -689,22 +698,28 @@ class DatabricksNamingGenerator:
                               resource_type: DatabricksResourceType,
                               additional_tags: dict[str, str] | None = None) -> dict[str, str]:
         """Generate standard tags for Databricks resources"""
-        tags = {
-            "Environment": self.config.environment,
-            "Project": self.config.project,
-            "ManagedBy": "terraform",
-            "ResourceType": resource_type.value,
-        }
+        standard_tags = self._standard_tags.get(resource_type)
+        if standard_tags is None:
+            standard_tags = {
+                "Environment": self.config.environment,
+                "Project": self.config.project,
+                "ManagedBy": "terraform",
+                "ResourceType": resource_type.value,
+            }
 
-        if self.config.team:
-            tags["Team"] = self.config.team
+            if self.config.team:
+                standard_tags["Team"] = self.config.team
 
-        if self.config.cost_center:
-            tags["CostCenter"] = self.config.cost_center
+            if self.config.cost_center:
+                standard_tags["CostCenter"] = self.config.cost_center
 
-        if self.config.data_classification:
-            tags["DataClassification"] = self.config.data_classification
+            if self.config.data_classification:
+                standard_tags["DataClassification"] = self.config.data_classification
+
+            self._standard_tags[resource_type] = standard_tags
 
+        # Fresh dict so callers can't mutate the cached tags
+        tags = dict(standard_tags)
         if additional_tags:
             tags.update(additional_tags)
 
@@ -31,7 +31,6 @@ def temp_home(tmp_path, monkeypatch):
     """Temporary home directory for testing."""
     home = tmp_path / "home"
     home.mkdir()
-    monkeypatch.setenv("HOME", str(home))
     # Change working directory to temp home so Path.cwd() points here
     monkeypatch.chdir(home)
     return home
@@ -40,10 +39,6 @@ def temp_home(tmp_path, monkeypatch):
 @pytest.fixture
 def example_configs(tmp_path):
     """Create example config files for testing."""
-    # Create structure: tmp_path/src/data_platform_naming/cli.py and tmp_path/examples/configs/
-    src_dir = tmp_path / "src" / "data_platform_naming"
-    src_dir.mkdir(parents=True)
-
     example_dir = tmp_path / "examples" / "configs"
     example_dir.mkdir(parents=True)
 
@@ -117,23 +112,28 @@ def example_configs(tmp_path):
     with open(example_dir / "naming-patterns.yaml", "w") as f:
         yaml.dump(patterns_content, f)
 
-    # Return both the cli.py path (for mocking __file__) and the examples dir
-    return {"cli_file": src_dir / "cli.py", "example_dir": example_dir}
+    return example_dir
+
+
+@pytest.fixture
+def patched_examples(monkeypatch, example_configs):
+    """Point 'config init' at the temporary example configs."""
+    monkeypatch.setattr(
+        "data_platform_naming.cli._examples_dir", lambda: example_configs
+    )
 
 
 class TestConfigInit:
     """Test config init command."""
 
-    def test_config_init_creates_files(self, runner, temp_home, example_configs):
+    def test_config_init_creates_files(self, runner, temp_home, patched_examples):
         """Test config init creates files in ~/.dpn/."""
-        # Mock __file__ to point to our test location with example configs
-        with patch("data_platform_naming.cli.__file__", str(example_configs["cli_file"])):
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "testproject",
-                "--environment", Environment.DEV.value,
-                "--region", "us-east-1"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "testproject",
+            "--environment", Environment.DEV.value,
+            "--region", "us-east-1"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
 
         assert result.exit_code == 0
         assert "Created:" in result.output
@@ -143,80 +143,76 @@ class TestConfigInit:
         assert (dpn_dir / "naming-values.yaml").exists()
         assert (dpn_dir / "naming-patterns.yaml").exists()
 
-    def test_config_init_customizes_values(self, runner, temp_home, example_configs):
+    def test_config_init_customizes_values(self, runner, temp_home, patched_examples):
         """Test config init customizes values file."""
-        with patch("data_platform_naming.cli.__file__", str(example_configs["cli_file"])):
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "oncology",
-                "--environment", Environment.PRD.value,
-                "--region", "us-west-2"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "oncology",
+            "--environment", Environment.PRD.value,
+            "--region", "us-west-2"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
 
         assert result.exit_code == 0
 
         values_file = temp_home / ".dpn" / "naming-values.yaml"
-        with open(values_file) as f:
-            values = yaml.safe_load(f)
+        values = yaml.safe_load(values_file.read_bytes())
 
         assert values["defaults"]["project"] == "oncology"
         assert values["defaults"]["environment"] == Environment.PRD.value
         assert values["defaults"]["region"] == "us-west-2"
 
-    def test_config_init_force_overwrite(self, runner, temp_home, example_configs):
+    def test_config_init_force_overwrite(self, runner, temp_home, patched_examples):
         """Test config init with --force overwrites existing files."""
-        with patch("data_platform_naming.cli.__file__", str(example_configs["cli_file"])):
-            # First init
-            runner.invoke(cli, [
-                "config", "init",
-                "--project", "testproject",
-                "--environment", Environment.DEV.value,
-                "--region", "us-east-1"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
-
-            # Second init without force should fail
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "newproject",
-                "--environment", Environment.PRD.value,
-                "--region", "us-west-2"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
+        # First init
+        runner.invoke(cli, [
+            "config", "init",
+            "--project", "testproject",
+            "--environment", Environment.DEV.value,
+            "--region", "us-east-1"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
+
+        # Second init without force should fail
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "newproject",
+            "--environment", Environment.PRD.value,
+            "--region", "us-west-2"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
 
-            assert result.exit_code == 1
-            assert "already" in result.output and "exist" in result.output
+        assert result.exit_code == 1
+        assert "already" in result.output and "exist" in result.output
 
-            # With --force should succeed
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "newproject",
-                "--environment", Environment.PRD.value,
-                "--region", "us-west-2",
-                "--force"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
+        # With --force should succeed
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "newproject",
+            "--environment", Environment.PRD.value,
+            "--region", "us-west-2",
+            "--force"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
         # Verify values were updated
         values_file = temp_home / ".dpn" / "naming-values.yaml"
-        with open(values_file) as f:
-            values = yaml.safe_load(f)
+        values = yaml.safe_load(values_file.read_bytes())
 
         assert values["defaults"]["project"] == "newproject"
 
-    def test_config_init_already_exists_error(self, runner, temp_home, example_configs):
+    def test_config_init_already_exists_error(self, runner, temp_home, patched_examples):
         """Test config init fails when files already exist without --force."""
         # Create files first
         dpn_dir = temp_home / ".dpn"
         dpn_dir.mkdir()
         (dpn_dir / "naming-values.yaml").touch()
 
-        with patch("data_platform_naming.cli.__file__", str(example_configs["cli_file"])):
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "testproject",
-                "--environment", Environment.DEV.value,
-                "--region", "us-east-1"
-            ], input="\n".join(["engineering", "data-platform", "all", "n"]))
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "testproject",
+            "--environment", Environment.DEV.value,
+            "--region", "us-east-1"
+        ], input="\n".join(["engineering", "data-platform", "all", "n"]),
+           env={"HOME": str(temp_home)})
 
         assert result.exit_code == 1
         assert "already" in result.output and "exist" in result.output
@@ -299,14 +295,14 @@ class TestConfigValidate:
         # Mock __file__ to point to our temp structure
         cli_file = src_dir / "cli.py"
         with patch("data_platform_naming.cli.__file__", str(cli_file)):
-            result = runner.invoke(cli, ["config", "validate"])
+            result = runner.invoke(cli, ["config", "validate"], env={"HOME": str(temp_home)})
 
         assert result.exit_code == 0
         assert "is valid" in result.output
 
     def test_config_validate_missing_files(self, runner, temp_home):
         """Test config validate when files don't exist."""
-        result = runner.invoke(cli, ["config", "validate"])
+        result = runner.invoke(cli, ["config", "validate"], env={"HOME": str(temp_home)})
 
         assert result.exit_code != 0
         assert "not found" in result.output
@@ -405,7 +401,7 @@ class TestConfigShow:
             mock_manager.patterns_loader.list_resource_types.return_value = list(patterns["patterns"].keys())
             mock_load.return_value = mock_manager
 
-            result = runner.invoke(cli, ["config", "show"])
+            result = runner.invoke(cli, ["config", "show"], env={"HOME": str(temp_home)})
 
         assert result.exit_code == 0
         assert "testproject" in result.output
@@ -433,7 +429,9 @@ class TestConfigShow:
             mock_manager.patterns_loader.get_all_patterns.return_value = {}
             mock_load.return_value = mock_manager
 
-            result = runner.invoke(cli, ["config", "show", "--format", "json"])
+            result = runner.invoke(
+                cli, ["config", "show", "--format", "json"], env={"HOME": str(temp_home)}
+            )
 
         assert result.exit_code == 0
         # JSON output should be parseable
@@ -466,7 +464,9 @@ class TestPlanPreviewWithConfig:
         with patch("data_platform_naming.cli.load_configuration_manager") as mock_load:
             mock_load.return_value = Mock()  # Config found
 
-            result = runner.invoke(cli, ["plan", "preview", str(blueprint)])
+            result = runner.invoke(
+                cli, ["plan", "preview", str(blueprint)], env={"HOME": str(temp_home)}
+            )
 
         # Should succeed (actual parsing will fail but config loading should work)
         assert "Using configuration-based naming" in result.output or result.exit_code is not None
@@ -493,7 +493,9 @@ class TestPlanPreviewWithConfig:
         with patch("data_platform_naming.cli.load_configuration_manager") as mock_load:
             mock_load.return_value = None  # No config
 
-            result = runner.invoke(cli, ["plan", "preview", str(blueprint)])
+            result = runner.invoke(
+                cli, ["plan", "preview", str(blueprint)], env={"HOME": str(temp_home)}
+            )
 
         # Should show message about configuration being required
         assert "Configuration files required" in result.output or "No configuration files found" in result.output
@@ -527,7 +529,7 @@ class TestCreateWithConfig:
                 "create",
                 "--blueprint", str(blueprint),
                 "--dry-run"
-            ])
+            ], env={"HOME": str(temp_home)})
 
         # Should show dry run message
         assert "DRY RUN" in result.output or result.exit_code is not None
@@ -536,17 +538,16 @@ class TestCreateWithConfig:
 class TestFullWorkflow:
     """Test complete user workflow."""
 
-    def test_init_validate_preview_workflow(self, runner, temp_home, example_configs, tmp_path):
+    def test_init_validate_preview_workflow(self, runner, temp_home, patched_examples, tmp_path):
         """Test full workflow: init → validate → preview."""
         # Step 1: Init
-        with patch("data_platform_naming.cli.__file__", str(example_configs["cli_file"])):
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "workflow-test",
-                "--environment", Environment.DEV.value,
-                "--region", "us-east-1"
-            ], input="\n".join(["engineering", "data-platform", "all"]))
-            assert result.exit_code == 0
+        result = runner.invoke(cli, [
+            "config", "init",
+            "--project", "workflow-test",
+            "--environment", Environment.DEV.value,
+            "--region", "us-east-1"
+        ], input="\n".join(["engineering", "data-platform", "all"]), env={"HOME": str(temp_home)})
+        assert result.exit_code == 0
 
         # Step 2: Validate
         # Create schema directory structure matching what CLI expects
@@ -567,7 +568,7 @@ class TestFullWorkflow:
         # Mock __file__ to point to our temp structure
         cli_file = src_dir / "cli.py"
         with patch("data_platform_naming.cli.__file__", str(cli_file)):
-            result = runner.invoke(cli, ["config", "validate"])
+            result = runner.invoke(cli, ["config", "validate"], env={"HOME": str(temp_home)})
             assert result.exit_code == 0
 
         # Step 3: Preview (would need full mocking for generators)
@@ -4,167 +4,127 @@ Comprehensive tests for interactive config init command.
 Tests both interactive prompts and non-interactive flag modes.
 """
 
+import os
+import uuid
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
 import pytest
 import yaml
 from click.testing import CliRunner
 
-from data_platform_naming.cli import _parse_resource_type_selection, cli
+from data_platform_naming.cli import cli
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
 
-@pytest.fixture
+EXAMPLE_CONFIGS_DIR = Path(__file__).parent / "data" / "examples" / "configs"
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file from its raw bytes."""
+    return yaml.load(path.read_bytes(), Loader=_Loader)
+
+
+def _dpn_files(dpn_dir: Path) -> set[str]:
+    """List a .dpn/ directory in one pass instead of one stat per file."""
+    return set(os.listdir(dpn_dir))
+
+
+# Leaf 'config init' command; most tests invoke it directly to skip group routing
+_INIT_CMD = cli.commands["config"].commands["init"]
+
+# Non-interactive 'config init' argv shared by tests that don't care about the values
+_BASE_ARGS = (
+    "--project", "test",
+    "--environment", "dev",
+    "--region", "us-east-1",
+    "--team", "test",
+    "--cost-center", "test",
+)
+
+# Just press enter for defaults, except project (required)
+_DEFAULTS_INPUT = "\n".join([
+    "",             # cost_center (use default)
+    "",             # environment (use default)
+    "testproj",     # project (required)
+    "",             # region (use default)
+    "",             # team (use default)
+    "all",          # resource types (all)
+])
+
+# Defaults with a new project; the overwrite confirmation answer is appended per test
+_OVERWRITE_INPUT = "\n".join([
+    "",         # cost_center
+    "",         # environment
+    "newproj",  # project
+    "",         # region
+    "",         # team
+    "all",      # resource types
+    "",         # overwrite confirmation follows
+])
+
+
+@pytest.fixture(scope="module")
 def runner():
-    """Click CLI test runner."""
+    """Click CLI test runner (stateless across invocations, shared per module)."""
     return CliRunner()
 
 
 @pytest.fixture
-def temp_project(tmp_path, monkeypatch):
-    """Temporary project directory."""
-    project_dir = tmp_path / "project"
+def temp_project(tmp_path_factory):
+    """Temporary project directory, passed to 'config init' via --config-dir."""
+    # A uuid-named directory under the session base temp skips tmp_path's
+    # per-test numbered-directory bookkeeping.
+    project_dir = tmp_path_factory.getbasetemp() / f"project-{uuid.uuid4().hex}"
     project_dir.mkdir()
-    monkeypatch.chdir(project_dir)
     return project_dir
 
 
-@pytest.fixture
-def example_configs(tmp_path):
-    """Create example config files for testing."""
-    # Mimic the package structure
-    example_dir = tmp_path / "examples" / "configs"
-    example_dir.mkdir(parents=True)
-
-    # Create naming-values.yaml template
-    values_content = {
-        "version": "1.0",
-        "defaults": {
-            "project": "template",
-            "environment": "dev",
-            "region": "us-east-1",
-            "team": "data-platform",
-            "cost_center": "engineering"
-        },
-        "environments": {
-            "dev": {"environment": "dev"},
-            "prd": {"environment": "prd"}
-        },
-        "resource_types": {}
-    }
-
-    with open(example_dir / "naming-values.yaml", "w") as f:
-        yaml.dump(values_content, f)
-
-    # Create naming-patterns.yaml
-    patterns_content = {
-        "version": "1.0",
-        "patterns": {
-            "aws_s3_bucket": "{project}-{purpose}-{layer}-{environment}-{region_code}",
-            "aws_glue_database": "{project}_{domain}_{layer}_{environment}",
-            "aws_lambda_function": "{project}-{environment}-{domain}",
-            "dbx_catalog": "{project}_{environment}",
-            "dbx_cluster": "{project}-{environment}"
-        },
-        "transformations": {
-            "region_mapping": {
-                "us-east-1": "use1",
-                "us-west-2": "usw2"
-            }
-        },
-        "validation": {
-            "max_length": {
-                "aws_s3_bucket": 63
-            }
-        }
-    }
-
-    with open(example_dir / "naming-patterns.yaml", "w") as f:
-        yaml.dump(patterns_content, f)
-
-    return example_dir
-
-
-class TestResourceTypeSelectionParser:
-    """Test the resource type selection parser."""
-
-    def test_parse_all(self):
-        """Test 'all' selection."""
-        types = ["aws_s3_bucket", "aws_glue_database", "dbx_catalog"]
-        result = _parse_resource_type_selection("all", types)
-        assert result == types
-
-    def test_parse_single_numbers(self):
-        """Test single number selection."""
-        types = ["aws_s3_bucket", "aws_glue_database", "dbx_catalog"]
-        result = _parse_resource_type_selection("1,3", types)
-        assert result == ["aws_s3_bucket", "dbx_catalog"]
-
-    def test_parse_range(self):
-        """Test range selection."""
-        types = ["type1", "type2", "type3", "type4", "type5"]
-        result = _parse_resource_type_selection("2-4", types)
-        assert result == ["type2", "type3", "type4"]
-
-    def test_parse_mixed(self):
-        """Test mixed selection."""
-        types = ["type1", "type2", "type3", "type4", "type5"]
-        result = _parse_resource_type_selection("1,3-4,5", types)
-        assert result == ["type1", "type3", "type4", "type5"]
-
-    def test_parse_invalid_numbers_ignored(self):
-        """Test invalid numbers are ignored."""
-        types = ["type1", "type2", "type3"]
-        result = _parse_resource_type_selection("1,5,10", types)
-        assert result == ["type1"]
-
-    def test_parse_empty_returns_empty(self):
-        """Test empty selection returns empty list."""
-        types = ["type1", "type2", "type3"]
-        result = _parse_resource_type_selection("", types)
-        assert result == []
+@pytest.fixture(scope="module")
+def example_configs():
+    """Checked-in example config files; tests only read them."""
+    return EXAMPLE_CONFIGS_DIR
+
+
+@pytest.fixture(autouse=True)
+def _examples_env(example_configs, monkeypatch):
+    """Point 'config init' at the checked-in tests/data/examples/configs."""
+    monkeypatch.setenv("DPN_EXAMPLES_DIR", str(example_configs))
 
 
 class TestInteractiveMode:
     """Test interactive prompts."""
 
-    def test_interactive_prompts_all_values(self, runner, temp_project, example_configs):
-        """Test all interactive prompts work correctly."""
-        # Mock the example directory path
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    # Return mock file location deep enough for .parent.parent.parent to work
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Provide inputs for all prompts
-            inputs = [
-                "engineering",  # cost_center
-                "prd",          # environment
-                "oncology",     # project
-                "us-west-2",    # region
-                "data-platform",  # team
-                "1,3",          # resource types
-            ]
-
-            result = runner.invoke(cli, ["config", "init"], input="\n".join(inputs))
+    pytestmark = pytest.mark.slow
+
+    def test_interactive_prompts_all_values(self, runner, temp_project):
+        """Test all interactive prompts work correctly (routed through the cli group)."""
+        # Provide inputs for all prompts
+        inputs = [
+            "engineering",  # cost_center
+            "prd",          # environment
+            "oncology",     # project
+            "us-west-2",    # region
+            "data-platform",  # team
+            "1,3",          # resource types
+        ]
+
+        result = runner.invoke(
+            cli, ["config", "init", "--config-dir", str(temp_project)], input="\n".join(inputs)
+        )
 
         assert result.exit_code == 0
         assert "Created:" in result.output
 
         # Check files were created
         dpn_dir = temp_project / ".dpn"
-        assert dpn_dir.exists()
-        assert (dpn_dir / "naming-values.yaml").exists()
-        assert (dpn_dir / "naming-patterns.yaml").exists()
+        assert _dpn_files(dpn_dir) >= {"naming-values.yaml", "naming-patterns.yaml"}
 
         # Check values were customized
-        with open(dpn_dir / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(dpn_dir / "naming-values.yaml")
 
         assert values["defaults"]["project"] == "oncology"
         assert values["defaults"]["environment"] == "prd"
@@ -172,33 +132,15 @@ class TestInteractiveMode:
         assert values["defaults"]["cost_center"] == "engineering"
         assert values["defaults"]["team"] == "data-platform"
 
-    def test_interactive_with_defaults(self, runner, temp_project, example_configs):
+    def test_interactive_with_defaults(self, runner, temp_project):
         """Test interactive mode with default values."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Just press enter for defaults, except project (required)
-            inputs = [
-                "",             # cost_center (use default)
-                "",             # environment (use default)
-                "testproj",     # project (required)
-                "",             # region (use default)
-                "",             # team (use default)
-                "all",          # resource types (all)
-            ]
-
-            result = runner.invoke(cli, ["config", "init"], input="\n".join(inputs))
+        result = runner.invoke(
+            _INIT_CMD, ["--config-dir", str(temp_project)], input=_DEFAULTS_INPUT
+        )
 
         assert result.exit_code == 0
 
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
         assert values["defaults"]["project"] == "testproj"
         assert values["defaults"]["environment"] == "dev"
@@ -208,33 +150,25 @@ class TestInteractiveMode:
 class TestNonInteractiveMode:
     """Test non-interactive flag mode."""
 
-    def test_fully_non_interactive(self, runner, temp_project, example_configs):
+    pytestmark = pytest.mark.slow
+
+    def test_fully_non_interactive(self, runner, temp_project):
         """Test fully non-interactive with all flags."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "analytics",
-                "--environment", "prd",
-                "--region", "us-west-2",
-                "--team", "data-eng",
-                "--cost-center", "analytics-dept",
-                "--resource-types", "1,3",
-                "--force"
-            ])
+        result = runner.invoke(_INIT_CMD, [
+            "--config-dir", str(temp_project),
+            "--project", "analytics",
+            "--environment", "prd",
+            "--region", "us-west-2",
+            "--team", "data-eng",
+            "--cost-center", "analytics-dept",
+            "--resource-types", "1,3",
+            "--force"
+        ])
 
         assert result.exit_code == 0
         assert "Created:" in result.output
 
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
         assert values["defaults"]["project"] == "analytics"
         assert values["defaults"]["environment"] == "prd"
@@ -242,35 +176,25 @@ class TestNonInteractiveMode:
         assert values["defaults"]["team"] == "data-eng"
         assert values["defaults"]["cost_center"] == "analytics-dept"
 
-    def test_partial_flags_prompts_missing(self, runner, temp_project, example_configs):
+    def test_partial_flags_prompts_missing(self, runner, temp_project):
         """Test partial flags prompts for missing values."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Provide some flags, let others be prompted
-            inputs = [
-                "",         # cost_center (use default)
-                "testproj", # project (prompted)
-                "",         # region (use default)
-                "all",      # resource types
-            ]
-
-            result = runner.invoke(
-                cli,
-                ["config", "init", "--environment", "prd", "--team", "data-platform"],
-                input="\n".join(inputs)
-            )
+        # Provide some flags, let others be prompted
+        inputs = [
+            "",         # cost_center (use default)
+            "testproj", # project (prompted)
+            "",         # region (use default)
+            "all",      # resource types
+        ]
+
+        result = runner.invoke(
+            _INIT_CMD,
+            ["--environment", "prd", "--team", "data-platform", "--config-dir", str(temp_project)],
+            input="\n".join(inputs)
+        )
 
         assert result.exit_code == 0
 
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
         assert values["defaults"]["project"] == "testproj"
         assert values["defaults"]["environment"] == "prd"  # From flag
@@ -280,232 +204,92 @@ class TestNonInteractiveMode:
 class TestResourceTypeSelection:
     """Test resource type multi-select."""
 
-    def test_select_specific_types(self, runner, temp_project, example_configs):
-        """Test selecting specific resource types."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test-team",
-                "--cost-center", "test-center",
-                "--resource-types", "2,3",
-                "--force"
-            ])
+    pytestmark = pytest.mark.slow
+
+    @pytest.mark.parametrize("selection,expected", [
+        ("2,3", {"aws_lambda_function", "aws_s3_bucket"}),
+        ("1-3", {"aws_glue_database", "aws_lambda_function", "aws_s3_bucket"}),
+        ("all", {
+            "aws_glue_database", "aws_lambda_function", "aws_s3_bucket",
+            "dbx_catalog", "dbx_cluster",
+        }),
+    ])
+    def test_select_resource_types(self, runner, temp_project, selection, expected):
+        """Test specific, range, and 'all' resource type selections."""
+        result = runner.invoke(_INIT_CMD, [
+            *_BASE_ARGS, "--config-dir", str(temp_project), "--resource-types", selection, "--force"
+        ])
 
         assert result.exit_code == 0
 
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
-        # Should have 2 resource types
-        assert len(values["resource_types"]) == 2
-        assert "aws_s3_bucket" in values["resource_types"]
-        assert "aws_lambda_function" in values["resource_types"]
-
-    def test_select_range_types(self, runner, temp_project, example_configs):
-        """Test selecting range of resource types."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "1-3",
-                "--force"
-            ])
-
-        assert result.exit_code == 0
-
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
-
-        # Should have 3 resource types (indices 1,2,3)
-        assert len(values["resource_types"]) == 3
-
-    def test_select_all_types(self, runner, temp_project, example_configs):
-        """Test selecting all resource types."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "all",
-                "--force"
-            ])
-
-        assert result.exit_code == 0
-
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
-
-        # Should have all 5 resource types from patterns
-        assert len(values["resource_types"]) == 5
+        assert set(values["resource_types"]) == expected
 
 
 class TestOverwriteConfirmation:
     """Test overwrite confirmation logic."""
 
-    def test_no_prompt_when_files_dont_exist(self, runner, temp_project, example_configs):
+    pytestmark = pytest.mark.slow
+
+    def test_no_prompt_when_files_dont_exist(self, runner, temp_project):
         """Test no confirmation prompt when files don't exist."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "all",
-            ])
+        result = runner.invoke(_INIT_CMD, [
+            *_BASE_ARGS, "--config-dir", str(temp_project), "--resource-types", "all"
+        ])
 
         assert result.exit_code == 0
         # Should not contain confirmation prompt
         assert "overwrite existing files" not in result.output.lower()
 
-    def test_confirmation_yes_overwrites(self, runner, temp_project, example_configs):
-        """Test Y confirmation overwrites files."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Create existing files first
-            dpn_dir = temp_project / ".dpn"
-            dpn_dir.mkdir()
-            (dpn_dir / "naming-values.yaml").write_text("existing: data")
-
-            inputs = [
-                "",         # cost_center
-                "",         # environment
-                "newproj",  # project
-                "",         # region
-                "",         # team
-                "all",      # resource types
-                "y",        # overwrite confirmation
-            ]
-
-            result = runner.invoke(cli, ["config", "init"], input="\n".join(inputs))
+    @pytest.mark.parametrize("confirm,exit_code,overwritten", [
+        ("y", 0, True),
+        ("n", 1, False),
+    ])
+    def test_confirmation_prompt(self, runner, temp_project, confirm, exit_code, overwritten):
+        """Test Y confirmation overwrites files and N cancels the operation."""
+        # Create existing files first
+        dpn_dir = temp_project / ".dpn"
+        dpn_dir.mkdir()
+        (dpn_dir / "naming-values.yaml").write_text("existing: data")
 
-        assert result.exit_code == 0
-        assert "Created:" in result.output
+        result = runner.invoke(
+            _INIT_CMD, ["--config-dir", str(temp_project)], input=_OVERWRITE_INPUT + confirm
+        )
 
-        # Check file was overwritten
-        with open(dpn_dir / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
-
-        assert values["defaults"]["project"] == "newproj"
-
-    def test_confirmation_no_cancels(self, runner, temp_project, example_configs):
-        """Test N confirmation cancels operation."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Create existing files
-            dpn_dir = temp_project / ".dpn"
-            dpn_dir.mkdir()
-            (dpn_dir / "naming-values.yaml").write_text("existing: data")
-
-            inputs = [
-                "",         # cost_center
-                "",         # environment
-                "newproj",  # project
-                "",         # region
-                "",         # team
-                "all",      # resource types
-                "n",        # overwrite confirmation - NO
-            ]
-
-            result = runner.invoke(cli, ["config", "init"], input="\n".join(inputs))
-
-        assert result.exit_code == 1
-        assert "Initialization cancelled" in result.output
-
-        # Check file was NOT overwritten
-        content = (dpn_dir / "naming-values.yaml").read_text()
-        assert content == "existing: data"
-
-    def test_force_flag_skips_confirmation(self, runner, temp_project, example_configs):
+        assert result.exit_code == exit_code
+
+        if overwritten:
+            assert "Created:" in result.output
+            values = _load_yaml(dpn_dir / "naming-values.yaml")
+            assert values["defaults"]["project"] == "newproj"
+        else:
+            assert "Initialization cancelled" in result.output
+            assert (dpn_dir / "naming-values.yaml").read_text() == "existing: data"
+
+    def test_force_flag_skips_confirmation(self, runner, temp_project):
         """Test --force flag skips confirmation prompt."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            # Create existing files
-            dpn_dir = temp_project / ".dpn"
-            dpn_dir.mkdir()
-            (dpn_dir / "naming-values.yaml").write_text("existing: data")
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "forced",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "all",
-                "--force"
-            ])
+        # Create existing files
+        dpn_dir = temp_project / ".dpn"
+        dpn_dir.mkdir()
+        (dpn_dir / "naming-values.yaml").write_text("existing: data")
+
+        result = runner.invoke(_INIT_CMD, [
+            "--config-dir", str(temp_project),
+            "--project", "forced",
+            "--environment", "dev",
+            "--region", "us-east-1",
+            "--team", "test",
+            "--cost-center", "test",
+            "--resource-types", "all",
+            "--force"
+        ])
 
         assert result.exit_code == 0
         assert "overwrite" not in result.output.lower()
 
         # Check file was overwritten
-        with open(dpn_dir / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(dpn_dir / "naming-values.yaml")
 
         assert values["defaults"]["project"] == "forced"
 
@@ -513,33 +297,25 @@ class TestOverwriteConfirmation:
 class TestValidStructure:
     """Test generated YAML structure is valid."""
 
-    def test_creates_valid_yaml_structure(self, runner, temp_project, example_configs):
+    pytestmark = pytest.mark.slow
+
+    def test_creates_valid_yaml_structure(self, runner, temp_project):
         """Test generated YAML has correct structure."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "prd",
-                "--region", "us-west-2",
-                "--team", "data-eng",
-                "--cost-center", "engineering",
-                "--resource-types", "1,3",
-                "--force"
-            ])
+        result = runner.invoke(_INIT_CMD, [
+            "--config-dir", str(temp_project),
+            "--project", "test",
+            "--environment", "prd",
+            "--region", "us-west-2",
+            "--team", "data-eng",
+            "--cost-center", "engineering",
+            "--resource-types", "1,3",
+            "--force"
+        ])
 
         assert result.exit_code == 0
 
         # Load and validate structure
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
         # Check top-level structure
         assert "version" in values
@@ -558,32 +334,15 @@ class TestValidStructure:
         for _rt, config in values["resource_types"].items():
             assert isinstance(config, dict)
 
-    def test_resource_types_populated_correctly(self, runner, temp_project, example_configs):
+    def test_resource_types_populated_correctly(self, runner, temp_project):
         """Test resource_types section is correctly populated."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if str(arg).endswith("cli.py"):
-                    return example_configs.parent.parent / "src" / "data_platform_naming" / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "1,3",
-                "--force"
-            ])
+        result = runner.invoke(_INIT_CMD, [
+            *_BASE_ARGS, "--config-dir", str(temp_project), "--resource-types", "1,3", "--force"
+        ])
 
         assert result.exit_code == 0
 
-        with open(temp_project / ".dpn" / "naming-values.yaml") as f:
-            values = yaml.safe_load(f)
+        values = _load_yaml(temp_project / ".dpn" / "naming-values.yaml")
 
         # Check selected types are present as empty dicts
         assert "aws_s3_bucket" in values["resource_types"]
@@ -592,36 +351,19 @@ class TestValidStructure:
         assert values["resource_types"]["aws_glue_database"] == {}
         assert values["resource_types"]["aws_s3_bucket"] == {}
 
-    def test_patterns_file_copied(self, runner, temp_project, example_configs):
+    def test_patterns_file_copied(self, runner, temp_project):
         """Test patterns file is copied correctly."""
-        with patch("data_platform_naming.cli.Path") as mock_path_cls:
-            def path_side_effect(arg):
-                if "__file__" in str(arg):
-                    return Path(example_configs.parent.parent) / "cli.py"
-                return Path(arg)
-
-            mock_path_cls.side_effect = path_side_effect
-            mock_path_cls.cwd.return_value = temp_project
-
-            result = runner.invoke(cli, [
-                "config", "init",
-                "--project", "test",
-                "--environment", "dev",
-                "--region", "us-east-1",
-                "--team", "test",
-                "--cost-center", "test",
-                "--resource-types", "all",
-                "--force"
-            ])
+        result = runner.invoke(_INIT_CMD, [
+            *_BASE_ARGS, "--config-dir", str(temp_project), "--resource-types", "all", "--force"
+        ])
 
         assert result.exit_code == 0
 
         # Check patterns file exists and has correct structure
         patterns_path = temp_project / ".dpn" / "naming-patterns.yaml"
-        assert patterns_path.exists()
+        assert "naming-patterns.yaml" in _dpn_files(patterns_path.parent)
 
-        with open(patterns_path) as f:
-            patterns = yaml.safe_load(f)
+        patterns = _load_yaml(patterns_path)
 
         assert "patterns" in patterns
         assert "transformations" in patterns
@@ -5,129 +5,270 @@ Validates JSON Schema definitions and example configurations
 """
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 import yaml
-from jsonschema import Draft7Validator, ValidationError, validate
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.validators import validator_for
 
 from data_platform_naming.constants import Environment
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+try:
+    import jsonschema_rs
+except ImportError:  # Rust-backed validator is optional; fall back to jsonschema
+    jsonschema_rs = None
+
+# Errors raised by the compiled validators for invalid configs
+SCHEMA_ERRORS = (ValidationError,) if jsonschema_rs is None else (
+    ValidationError, jsonschema_rs.ValidationError
+)
+
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
+SCHEMAS_DIR = PROJECT_ROOT / "schemas"
+EXAMPLES_DIR = PROJECT_ROOT / "examples" / "configs"
+
+_VALUES_SCHEMA_PATH = SCHEMAS_DIR / "naming-values-schema.json"
+_PATTERNS_SCHEMA_PATH = SCHEMAS_DIR / "naming-patterns-schema.json"
+_VALUES_EXAMPLE_PATH = EXAMPLES_DIR / "naming-values.yaml"
+_PATTERNS_EXAMPLE_PATH = EXAMPLES_DIR / "naming-patterns.yaml"
+
+
+def _dir_entries(directory):
+    """Names in a directory, from a single scandir() instead of one stat per file"""
+    with os.scandir(directory) as it:
+        return {entry.name for entry in it}
+
+
+# Minimal valid patterns section: all 13 AWS and 14 Databricks resource types.
+# Shared by the patterns tests; never mutated (tests spread it into new dicts).
+_BASE_PATTERNS = {
+    # All 13 AWS patterns
+    "aws_s3_bucket": "{project}-{environment}",
+    "aws_glue_database": "{project}_{environment}",
+    "aws_glue_table": "{entity}",
+    "aws_glue_crawler": "{project}",
+    "aws_lambda_function": "{project}",
+    "aws_iam_role": "{project}",
+    "aws_iam_policy": "{project}",
+    "aws_kinesis_stream": "{project}",
+    "aws_kinesis_firehose": "{project}",
+    "aws_dynamodb_table": "{project}",
+    "aws_sns_topic": "{project}",
+    "aws_sqs_queue": "{project}",
+    "aws_step_function": "{project}",
+    # All 14 Databricks patterns
+    "dbx_workspace": "{project}",
+    "dbx_cluster": "{project}-{environment}",
+    "dbx_job": "{project}-{environment}",
+    "dbx_notebook_path": "/{project}",
+    "dbx_repo": "{project}",
+    "dbx_pipeline": "{project}",
+    "dbx_sql_warehouse": "{project}",
+    "dbx_catalog": "{project}_{environment}",
+    "dbx_schema": "{domain}",
+    "dbx_table": "{entity}",
+    "dbx_volume": "{project}",
+    "dbx_secret_scope": "{project}",
+    "dbx_instance_pool": "{project}",
+    "dbx_policy": "{project}"
+}
+
+# Smallest naming-values config the schema accepts
+_MINIMAL_CONFIG = {
+    "version": "1.0",
+    "defaults": {
+        "project": "testproject",
+        "environment": Environment.DEV.value
+    }
+}
+
+# naming-values config exercising every section
+_FULL_CONFIG = {
+    "version": "1.0",
+    "defaults": {
+        "project": "dataplatform",
+        "environment": Environment.PRD.value,
+        "region": "us-east-1",
+        "region_short": "use1",
+        "team": "data-team",
+        "cost_center": "CC-12345"
+    },
+    "environments": {
+        "dev": {
+            "environment": Environment.DEV.value,
+            "data_classification": "internal"
+        },
+        "stg": {
+            "environment": Environment.STG.value
+        },
+        "prd": {
+            "environment": Environment.PRD.value,
+            "data_classification": "confidential"
+        }
+    },
+    "resource_types": {
+        "aws_s3_bucket": {
+            "purpose": "raw",
+            "layer": "raw"
+        },
+        "dbx_cluster": {
+            "workload": "etl"
+        }
+    }
+}
+
+# naming-patterns config with a valid transformations section
+_TRANSFORMATIONS_CONFIG = {
+    "version": "1.0",
+    "patterns": _BASE_PATTERNS,
+    "transformations": {
+        "region_mapping": {
+            "us-east-1": "use1",
+            "us-west-2": "usw2"
+        },
+        "lowercase": ["project", "environment"],
+        "uppercase": ["cost_center"],
+        "replace_hyphens": {
+            "project": "_"
+        }
+    }
+}
+
+# naming-patterns config with a valid validation section
+_VALIDATION_CONFIG = {
+    "version": "1.0",
+    "patterns": _BASE_PATTERNS,
+    "validation": {
+        "max_length": {
+            "aws_s3_bucket": 63,
+            "dbx_cluster": 100
+        },
+        "allowed_chars": {
+            "aws_s3_bucket": "^[a-z0-9-]+$",
+            "aws_glue_database": "^[a-z0-9_]+$"
+        },
+        "required_variables": {
+            "aws_s3_bucket": ["project", "environment"],
+            "dbx_cluster": ["project", "workload"]
+        }
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def values_schema():
+    """Load naming-values schema"""
+    return json.loads(_VALUES_SCHEMA_PATH.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def values_example():
+    """Load example naming-values.yaml"""
+    return yaml.load(_VALUES_EXAMPLE_PATH.read_bytes(), Loader=_Loader)
+
+
+@pytest.fixture(scope="session")
+def patterns_schema():
+    """Load naming-patterns schema"""
+    return json.loads(_PATTERNS_SCHEMA_PATH.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def patterns_example():
+    """Load example naming-patterns.yaml"""
+    return yaml.load(_PATTERNS_EXAMPLE_PATH.read_bytes(), Loader=_Loader)
+
+
+def _compile_validator(schema):
+    """Check a schema once and build a reusable validator for it
+
+    Uses jsonschema-rs when installed; the meta-check always runs through
+    jsonschema so schema errors are reported the same way either way.
+    """
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    if jsonschema_rs is not None:
+        return jsonschema_rs.validator_for(schema)
+    return cls(schema)
+
+
+@pytest.fixture(scope="session")
+def values_validator(values_schema):
+    """Compiled naming-values schema validator"""
+    return _compile_validator(values_schema)
+
+
+@pytest.fixture(scope="session")
+def patterns_validator(patterns_schema):
+    """Compiled naming-patterns schema validator"""
+    return _compile_validator(patterns_schema)
 
 
 class TestNamingValuesSchema:
     """Test naming-values-schema.json"""
 
-    @pytest.fixture
-    def schema(self):
-        """Load naming-values schema"""
-        schema_path = PROJECT_ROOT / "schemas" / "naming-values-schema.json"
-        with open(schema_path) as f:
-            return json.load(f)
-
-    @pytest.fixture
-    def example_config(self):
-        """Load example naming-values.yaml"""
-        config_path = PROJECT_ROOT / "examples" / "configs" / "naming-values.yaml"
-        with open(config_path) as f:
-            return yaml.safe_load(f)
-
-    def test_schema_is_valid_json_schema(self, schema):
+    def test_schema_is_valid_json_schema(self, values_schema):
         """Verify the schema itself is valid JSON Schema Draft 7"""
-        Draft7Validator.check_schema(schema)
+        Draft7Validator.check_schema(values_schema)
 
-    def test_schema_has_required_properties(self, schema):
+    def test_schema_has_required_properties(self, values_schema):
         """Verify schema has all required top-level properties"""
-        assert "$schema" in schema
-        assert schema["$schema"] == "http://json-schema.org/draft-07/schema#"
-        assert "title" in schema
-        assert "description" in schema
-        assert "type" in schema
-        assert schema["type"] == "object"
-        assert "required" in schema
-        assert "version" in schema["required"]
-        assert "defaults" in schema["required"]
-
-    def test_example_config_validates(self, schema, example_config):
+        assert "$schema" in values_schema
+        assert values_schema["$schema"] == "http://json-schema.org/draft-07/schema#"
+        assert "title" in values_schema
+        assert "description" in values_schema
+        assert "type" in values_schema
+        assert values_schema["type"] == "object"
+        assert "required" in values_schema
+        assert "version" in values_schema["required"]
+        assert "defaults" in values_schema["required"]
+
+    def test_example_config_validates(self, values_validator, values_example):
         """Verify example naming-values.yaml validates against schema"""
-        validate(instance=example_config, schema=schema)
+        values_validator.validate(values_example)
 
-    def test_valid_minimal_config(self, schema):
+    def test_valid_minimal_config(self, values_validator):
         """Test minimal valid configuration"""
-        config = {
-            "version": "1.0",
-            "defaults": {
-                "project": "testproject",
-                "environment": Environment.DEV.value
-            }
-        }
-        validate(instance=config, schema=schema)
+        values_validator.validate(_MINIMAL_CONFIG)
 
-    def test_valid_full_config(self, schema):
+    def test_valid_full_config(self, values_validator):
         """Test full configuration with all sections"""
-        config = {
-            "version": "1.0",
-            "defaults": {
-                "project": "dataplatform",
-                "environment": Environment.PRD.value,
-                "region": "us-east-1",
-                "region_short": "use1",
-                "team": "data-team",
-                "cost_center": "CC-12345"
-            },
-            "environments": {
-                "dev": {
-                    "environment": Environment.DEV.value,
-                    "data_classification": "internal"
-                },
-                "stg": {
-                    "environment": Environment.STG.value
-                },
-                "prd": {
-                    "environment": Environment.PRD.value,
-                    "data_classification": "confidential"
-                }
-            },
-            "resource_types": {
-                "aws_s3_bucket": {
-                    "purpose": "raw",
-                    "layer": "raw"
-                },
-                "dbx_cluster": {
-                    "workload": "etl"
-                }
-            }
-        }
-        validate(instance=config, schema=schema)
+        values_validator.validate(_FULL_CONFIG)
 
-    def test_invalid_version(self, schema):
+    def test_invalid_version(self, values_validator):
         """Test that invalid version is rejected"""
         config = {
             "version": "2.0",  # Invalid version
             "defaults": {"project": "test"}
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
 
-    def test_missing_required_version(self, schema):
+    def test_missing_required_version(self, values_validator):
         """Test that missing version is rejected"""
         config = {
             "defaults": {"project": "test"}
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
 
-    def test_missing_required_defaults(self, schema):
+    def test_missing_required_defaults(self, values_validator):
         """Test that missing defaults is rejected"""
         config = {
             "version": "1.0"
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
 
-    def test_invalid_environment_name(self, schema):
+    def test_invalid_environment_name(self, values_validator):
         """Test that invalid environment name is rejected"""
         config = {
             "version": "1.0",
@@ -136,10 +277,10 @@ class TestNamingValuesSchema:
                 "production": {"environment": "production"}  # Invalid, should be 'prd'
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
 
-    def test_invalid_project_format(self, schema):
+    def test_invalid_project_format(self, values_validator):
         """Test that invalid project format is rejected"""
         config = {
             "version": "1.0",
@@ -147,26 +288,25 @@ class TestNamingValuesSchema:
                 "project": "Data_Platform"  # Invalid: uppercase and underscore
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
-
-    def test_valid_project_formats(self, schema):
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
+
+    @pytest.mark.parametrize("project", [
+        "dataplatform",
+        "data-platform",
+        "platform123",
+        "123platform",
+        "data-platform-v2"
+    ])
+    def test_valid_project_formats(self, values_validator, project):
         """Test various valid project name formats"""
-        valid_projects = [
-            "dataplatform",
-            "data-platform",
-            "platform123",
-            "123platform",
-            "data-platform-v2"
-        ]
-        for project in valid_projects:
-            config = {
-                "version": "1.0",
-                "defaults": {"project": project}
-            }
-            validate(instance=config, schema=schema)
+        config = {
+            "version": "1.0",
+            "defaults": {"project": project}
+        }
+        values_validator.validate(config)
 
-    def test_invalid_region_format(self, schema):
+    def test_invalid_region_format(self, values_validator):
         """Test that invalid region format is rejected"""
         config = {
             "version": "1.0",
@@ -175,28 +315,27 @@ class TestNamingValuesSchema:
                 "region": "us_east_1"  # Invalid: underscores instead of hyphens
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
-
-    def test_valid_region_formats(self, schema):
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
+
+    @pytest.mark.parametrize("region", [
+        "us-east-1",
+        "us-west-2",
+        "eu-west-1",
+        "ap-southeast-1"
+    ])
+    def test_valid_region_formats(self, values_validator, region):
         """Test various valid region formats"""
-        valid_regions = [
-            "us-east-1",
-            "us-west-2",
-            "eu-west-1",
-            "ap-southeast-1"
-        ]
-        for region in valid_regions:
-            config = {
-                "version": "1.0",
-                "defaults": {
-                    "project": "test",
-                    "region": region
-                }
+        config = {
+            "version": "1.0",
+            "defaults": {
+                "project": "test",
+                "region": region
             }
-            validate(instance=config, schema=schema)
+        }
+        values_validator.validate(config)
 
-    def test_custom_variables(self, schema):
+    def test_custom_variables(self, values_validator):
         """Test that custom variables are allowed"""
         config = {
             "version": "1.0",
@@ -207,22 +346,23 @@ class TestNamingValuesSchema:
                 "business_unit": "analytics"
             }
         }
-        validate(instance=config, schema=schema)
+        values_validator.validate(config)
 
-    def test_valid_data_classification_values(self, schema):
+    @pytest.mark.parametrize(
+        "classification", ["public", "internal", "confidential", "restricted"]
+    )
+    def test_valid_data_classification_values(self, values_validator, classification):
         """Test all valid data classification values"""
-        classifications = ["public", "internal", "confidential", "restricted"]
-        for classification in classifications:
-            config = {
-                "version": "1.0",
-                "defaults": {
-                    "project": "test",
-                    "data_classification": classification
-                }
+        config = {
+            "version": "1.0",
+            "defaults": {
+                "project": "test",
+                "data_classification": classification
             }
-            validate(instance=config, schema=schema)
+        }
+        values_validator.validate(config)
 
-    def test_invalid_data_classification(self, schema):
+    def test_invalid_data_classification(self, values_validator):
         """Test that invalid data classification is rejected"""
         config = {
             "version": "1.0",
@@ -231,86 +371,42 @@ class TestNamingValuesSchema:
                 "data_classification": "secret"  # Invalid
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            values_validator.validate(config)
 
 
 class TestNamingPatternsSchema:
     """Test naming-patterns-schema.json"""
 
-    @pytest.fixture
-    def schema(self):
-        """Load naming-patterns schema"""
-        schema_path = PROJECT_ROOT / "schemas" / "naming-patterns-schema.json"
-        with open(schema_path) as f:
-            return json.load(f)
-
-    @pytest.fixture
-    def example_config(self):
-        """Load example naming-patterns.yaml"""
-        config_path = PROJECT_ROOT / "examples" / "configs" / "naming-patterns.yaml"
-        with open(config_path) as f:
-            return yaml.safe_load(f)
-
-    def test_schema_is_valid_json_schema(self, schema):
+    def test_schema_is_valid_json_schema(self, patterns_schema):
         """Verify the schema itself is valid JSON Schema Draft 7"""
-        Draft7Validator.check_schema(schema)
+        Draft7Validator.check_schema(patterns_schema)
 
-    def test_schema_has_required_properties(self, schema):
+    def test_schema_has_required_properties(self, patterns_schema):
         """Verify schema has all required top-level properties"""
-        assert "$schema" in schema
-        assert schema["$schema"] == "http://json-schema.org/draft-07/schema#"
-        assert "title" in schema
-        assert "description" in schema
-        assert "type" in schema
-        assert schema["type"] == "object"
-        assert "required" in schema
-        assert "version" in schema["required"]
-        assert "patterns" in schema["required"]
-
-    def test_example_config_validates(self, schema, example_config):
+        assert "$schema" in patterns_schema
+        assert patterns_schema["$schema"] == "http://json-schema.org/draft-07/schema#"
+        assert "title" in patterns_schema
+        assert "description" in patterns_schema
+        assert "type" in patterns_schema
+        assert patterns_schema["type"] == "object"
+        assert "required" in patterns_schema
+        assert "version" in patterns_schema["required"]
+        assert "patterns" in patterns_schema["required"]
+
+    def test_example_config_validates(self, patterns_validator, patterns_example):
         """Verify example naming-patterns.yaml validates against schema"""
-        validate(instance=example_config, schema=schema)
+        patterns_validator.validate(patterns_example)
 
-    def test_valid_minimal_config(self, schema):
+    def test_valid_minimal_config(self, patterns_validator):
         """Test minimal valid configuration with all required patterns"""
         config = {
             "version": "1.0",
-            "patterns": {
-                # All 13 AWS patterns
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                # All 14 Databricks patterns
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
-            }
+            "patterns": _BASE_PATTERNS
         }
-        validate(instance=config, schema=schema)
+        patterns_validator.validate(config)
 
-    def test_missing_required_pattern(self, schema):
+    def test_missing_required_pattern(self, patterns_validator):
         """Test that missing required pattern is rejected"""
         config = {
             "version": "1.0",
@@ -319,308 +415,86 @@ class TestNamingPatternsSchema:
                 # Missing other required patterns
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            patterns_validator.validate(config)
 
-    def test_invalid_pattern_no_placeholder(self, schema):
+    def test_invalid_pattern_no_placeholder(self, patterns_validator):
         """Test that pattern without placeholder is rejected"""
         config = {
             "version": "1.0",
             "patterns": {
-                "aws_s3_bucket": "static-name",  # Invalid: no placeholder
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
+                **_BASE_PATTERNS,
+                "aws_s3_bucket": "static-name"  # Invalid: no placeholder
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
-
-    def test_valid_pattern_formats(self, schema):
+        with pytest.raises(SCHEMA_ERRORS):
+            patterns_validator.validate(config)
+
+    @pytest.mark.parametrize("pattern", [
+        "{project}-{environment}",
+        "{project}_{domain}_{layer}",
+        "{table_type}_{entity}",
+        "{project}-{workload}-{cluster_type}-{environment}",
+        "prefix-{project}-{environment}-suffix"
+    ])
+    def test_valid_pattern_formats(self, patterns_validator, pattern):
         """Test various valid pattern formats"""
-        valid_patterns = [
-            "{project}-{environment}",
-            "{project}_{domain}_{layer}",
-            "{table_type}_{entity}",
-            "{project}-{workload}-{cluster_type}-{environment}",
-            "prefix-{project}-{environment}-suffix"
-        ]
-        for pattern in valid_patterns:
-            config = {
-                "version": "1.0",
-                "patterns": {
-                    "aws_s3_bucket": pattern,
-                    "aws_glue_database": "{project}_{environment}",
-                    "aws_glue_table": "{entity}",
-                    "aws_glue_crawler": "{project}",
-                    "aws_lambda_function": "{project}",
-                    "aws_iam_role": "{project}",
-                    "aws_iam_policy": "{project}",
-                    "aws_kinesis_stream": "{project}",
-                    "aws_kinesis_firehose": "{project}",
-                    "aws_dynamodb_table": "{project}",
-                    "aws_sns_topic": "{project}",
-                    "aws_sqs_queue": "{project}",
-                    "aws_step_function": "{project}",
-                    "dbx_workspace": "{project}",
-                    "dbx_cluster": "{project}-{environment}",
-                    "dbx_job": "{project}-{environment}",
-                    "dbx_notebook_path": "/{project}",
-                    "dbx_repo": "{project}",
-                    "dbx_pipeline": "{project}",
-                    "dbx_sql_warehouse": "{project}",
-                    "dbx_catalog": "{project}_{environment}",
-                    "dbx_schema": "{domain}",
-                    "dbx_table": "{entity}",
-                    "dbx_volume": "{project}",
-                    "dbx_secret_scope": "{project}",
-                    "dbx_instance_pool": "{project}",
-                    "dbx_policy": "{project}"
-                }
-            }
-            validate(instance=config, schema=schema)
-
-    def test_valid_transformations_section(self, schema):
-        """Test valid transformations configuration"""
         config = {
             "version": "1.0",
             "patterns": {
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
-            },
-            "transformations": {
-                "region_mapping": {
-                    "us-east-1": "use1",
-                    "us-west-2": "usw2"
-                },
-                "lowercase": ["project", "environment"],
-                "uppercase": ["cost_center"],
-                "replace_hyphens": {
-                    "project": "_"
-                }
+                **_BASE_PATTERNS,
+                "aws_s3_bucket": pattern
             }
         }
-        validate(instance=config, schema=schema)
+        patterns_validator.validate(config)
 
-    def test_invalid_region_mapping_format(self, schema):
+    def test_valid_transformations_section(self, patterns_validator):
+        """Test valid transformations configuration"""
+        patterns_validator.validate(_TRANSFORMATIONS_CONFIG)
+
+    def test_invalid_region_mapping_format(self, patterns_validator):
         """Test that invalid region mapping format is rejected"""
         config = {
             "version": "1.0",
-            "patterns": {
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
-            },
+            "patterns": _BASE_PATTERNS,
             "transformations": {
                 "region_mapping": {
                     "us_east_1": "use1"  # Invalid: underscores instead of hyphens
                 }
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            patterns_validator.validate(config)
 
-    def test_valid_validation_section(self, schema):
+    def test_valid_validation_section(self, patterns_validator):
         """Test valid validation rules configuration"""
-        config = {
-            "version": "1.0",
-            "patterns": {
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
-            },
-            "validation": {
-                "max_length": {
-                    "aws_s3_bucket": 63,
-                    "dbx_cluster": 100
-                },
-                "allowed_chars": {
-                    "aws_s3_bucket": "^[a-z0-9-]+$",
-                    "aws_glue_database": "^[a-z0-9_]+$"
-                },
-                "required_variables": {
-                    "aws_s3_bucket": ["project", "environment"],
-                    "dbx_cluster": ["project", "workload"]
-                }
-            }
-        }
-        validate(instance=config, schema=schema)
+        patterns_validator.validate(_VALIDATION_CONFIG)
 
-    def test_invalid_max_length_zero(self, schema):
+    def test_invalid_max_length_zero(self, patterns_validator):
         """Test that zero max_length is rejected"""
         config = {
             "version": "1.0",
-            "patterns": {
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}"
-            },
+            "patterns": _BASE_PATTERNS,
             "validation": {
                 "max_length": {
                     "aws_s3_bucket": 0  # Invalid: must be >= 1
                 }
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            patterns_validator.validate(config)
 
-    def test_additional_pattern_not_allowed(self, schema):
+    def test_additional_pattern_not_allowed(self, patterns_validator):
         """Test that additional (unlisted) patterns are rejected"""
         config = {
             "version": "1.0",
             "patterns": {
-                "aws_s3_bucket": "{project}-{environment}",
-                "aws_glue_database": "{project}_{environment}",
-                "aws_glue_table": "{entity}",
-                "aws_glue_crawler": "{project}",
-                "aws_lambda_function": "{project}",
-                "aws_iam_role": "{project}",
-                "aws_iam_policy": "{project}",
-                "aws_kinesis_stream": "{project}",
-                "aws_kinesis_firehose": "{project}",
-                "aws_dynamodb_table": "{project}",
-                "aws_sns_topic": "{project}",
-                "aws_sqs_queue": "{project}",
-                "aws_step_function": "{project}",
-                "dbx_workspace": "{project}",
-                "dbx_cluster": "{project}-{environment}",
-                "dbx_job": "{project}-{environment}",
-                "dbx_notebook_path": "/{project}",
-                "dbx_repo": "{project}",
-                "dbx_pipeline": "{project}",
-                "dbx_sql_warehouse": "{project}",
-                "dbx_catalog": "{project}_{environment}",
-                "dbx_schema": "{domain}",
-                "dbx_table": "{entity}",
-                "dbx_volume": "{project}",
-                "dbx_secret_scope": "{project}",
-                "dbx_instance_pool": "{project}",
-                "dbx_policy": "{project}",
+                **_BASE_PATTERNS,
                 "custom_resource": "{project}"  # Invalid: not allowed
             }
         }
-        with pytest.raises(ValidationError):
-            validate(instance=config, schema=schema)
+        with pytest.raises(SCHEMA_ERRORS):
+            patterns_validator.validate(config)
 
 
 class TestSchemaIntegration:
@@ -628,67 +502,44 @@ class TestSchemaIntegration:
 
     def test_example_files_exist(self):
         """Verify all example files exist"""
-        assert (PROJECT_ROOT / "schemas" / "naming-values-schema.json").exists()
-        assert (PROJECT_ROOT / "schemas" / "naming-patterns-schema.json").exists()
-        assert (PROJECT_ROOT / "examples" / "configs" / "naming-values.yaml").exists()
-        assert (PROJECT_ROOT / "examples" / "configs" / "naming-patterns.yaml").exists()
+        schema_files = _dir_entries(SCHEMAS_DIR)
+        example_files = _dir_entries(EXAMPLES_DIR)
+        assert _VALUES_SCHEMA_PATH.name in schema_files
+        assert _PATTERNS_SCHEMA_PATH.name in schema_files
+        assert _VALUES_EXAMPLE_PATH.name in example_files
+        assert _PATTERNS_EXAMPLE_PATH.name in example_files
 
     def test_schemas_directory_structure(self):
         """Verify schemas directory has expected structure"""
-        schemas_dir = PROJECT_ROOT / "schemas"
-        assert schemas_dir.exists()
-        assert (schemas_dir / "README.md").exists()
-        assert (schemas_dir / "naming-values-schema.json").exists()
-        assert (schemas_dir / "naming-patterns-schema.json").exists()
+        assert _dir_entries(SCHEMAS_DIR) >= {
+            "README.md",
+            _VALUES_SCHEMA_PATH.name,
+            _PATTERNS_SCHEMA_PATH.name,
+        }
 
     def test_examples_directory_structure(self):
         """Verify examples directory has expected structure"""
-        examples_dir = PROJECT_ROOT / "examples" / "configs"
-        assert examples_dir.exists()
-        assert (examples_dir / "naming-values.yaml").exists()
-        assert (examples_dir / "naming-patterns.yaml").exists()
+        assert _dir_entries(EXAMPLES_DIR) >= {
+            _VALUES_EXAMPLE_PATH.name,
+            _PATTERNS_EXAMPLE_PATH.name,
+        }
 
-    def test_both_examples_validate(self):
+    def test_both_examples_validate(
+        self, values_validator, patterns_validator, values_example, patterns_example
+    ):
         """Verify both example files validate against their schemas"""
-        # Load schemas
-        with open(PROJECT_ROOT / "schemas" / "naming-values-schema.json") as f:
-            values_schema = json.load(f)
-
-        with open(PROJECT_ROOT / "schemas" / "naming-patterns-schema.json") as f:
-            patterns_schema = json.load(f)
-
-        # Load examples
-        with open(PROJECT_ROOT / "examples" / "configs" / "naming-values.yaml") as f:
-            values_config = yaml.safe_load(f)
-
-        with open(PROJECT_ROOT / "examples" / "configs" / "naming-patterns.yaml") as f:
-            patterns_config = yaml.safe_load(f)
+        values_validator.validate(values_example)
+        patterns_validator.validate(patterns_example)
 
-        # Validate
-        validate(instance=values_config, schema=values_schema)
-        validate(instance=patterns_config, schema=patterns_schema)
-
-    def test_schema_version_consistency(self):
+    def test_schema_version_consistency(self, values_schema, patterns_schema):
         """Verify both schemas use same JSON Schema version"""
-        with open(PROJECT_ROOT / "schemas" / "naming-values-schema.json") as f:
-            values_schema = json.load(f)
-
-        with open(PROJECT_ROOT / "schemas" / "naming-patterns-schema.json") as f:
-            patterns_schema = json.load(f)
-
         assert values_schema["$schema"] == patterns_schema["$schema"]
         assert values_schema["$schema"] == "http://json-schema.org/draft-07/schema#"
 
-    def test_example_version_consistency(self):
+    def test_example_version_consistency(self, values_example, patterns_example):
         """Verify both example files use same version"""
-        with open(PROJECT_ROOT / "examples" / "configs" / "naming-values.yaml") as f:
-            values_config = yaml.safe_load(f)
-
-        with open(PROJECT_ROOT / "examples" / "configs" / "naming-patterns.yaml") as f:
-            patterns_config = yaml.safe_load(f)
-
-        assert values_config["version"] == patterns_config["version"]
-        assert values_config["version"] == "1.0"
+        assert values_example["version"] == patterns_example["version"]
+        assert values_example["version"] == "1.0"
 
 
 if __name__ == "__main__":
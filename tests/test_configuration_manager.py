@@ -3,10 +3,13 @@
 Tests for ConfigurationManager class.
 """
 
+import copy
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
+import yaml
 
 from data_platform_naming.config.configuration_manager import (
     ConfigurationManager,
@@ -46,11 +49,37 @@ class TestGeneratedName:
         )
         assert name.is_valid is False
 
+    def test_frozen_slots(self):
+        """Test GeneratedName is immutable and has no per-instance __dict__"""
+        name = GeneratedName(
+            name="test-name",
+            resource_type="aws_s3_bucket",
+            pattern_used="{project}",
+            values_used={"project": "test"},
+            validation_errors=[]
+        )
+        assert not hasattr(name, "__dict__")
+        with pytest.raises(AttributeError):
+            name.name = "other"  # type: ignore[misc]
+
+    def test_is_valid_follows_replace(self):
+        """Test is_valid is recomputed when a copy changes validation_errors"""
+        name = GeneratedName(
+            name="test-name",
+            resource_type="aws_s3_bucket",
+            pattern_used="{project}",
+            values_used={"project": "test"},
+            validation_errors=[]
+        )
+        invalid = replace(name, validation_errors=["Name too long"])
+        assert name.is_valid is True
+        assert invalid.is_valid is False
+
 
 class TestConfigurationManager:
     """Test ConfigurationManager class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def values_config(self):
         """Valid values configuration"""
         return {
@@ -76,7 +105,7 @@ class TestConfigurationManager:
             }
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def patterns_config(self):
         """Valid patterns configuration with all 27 resource types"""
         return {
@@ -138,6 +167,13 @@ class TestConfigurationManager:
         assert manager.patterns_loader is not None
         assert manager.is_loaded is False
 
+    def test_slots(self):
+        """Test managers carry no per-instance __dict__"""
+        manager = ConfigurationManager()
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.unexpected = True
+
     def test_init_with_custom_loaders(self):
         """Test initialization with custom loaders"""
         from data_platform_naming.config import NamingPatternsLoader, NamingValuesLoader
@@ -178,6 +214,54 @@ class TestConfigurationManager:
         with pytest.raises(ConfigurationError, match="patterns_path or patterns_dict"):
             manager.load_configs(values_dict=values_config)
 
+    def test_load_configs_skips_identical_inputs(self, values_config, patterns_config):
+        """Test reloading equal configs keeps the loaded state and generated names"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+
+        manager.load_configs(
+            values_dict=copy.deepcopy(values_config),
+            patterns_dict=copy.deepcopy(patterns_config)
+        )
+
+        assert manager.values_loader.config is values_config
+        assert manager._generate_name_cached.cache_info().currsize == 1
+
+    def test_load_configs_reloads_after_direct_loader_reload(
+        self, values_config, patterns_config
+    ):
+        """Test identical inputs are reloaded if a loader was reloaded directly since"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        manager.values_loader.load_from_dict({
+            **values_config,
+            "defaults": {**values_config["defaults"], "project": "other"}
+        })
+
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        result = manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+        assert result.name == "testproject-raw-raw-prd-use1"
+
+    def test_load_configs_reloads_changed_file(self, tmp_path, values_config, patterns_config):
+        """Test a config file edited since the last load is reloaded"""
+        values_path = tmp_path / "naming-values.yaml"
+        patterns_path = tmp_path / "naming-patterns.yaml"
+        values_path.write_text(yaml.dump(values_config))
+        patterns_path.write_text(yaml.dump(patterns_config))
+        manager = ConfigurationManager()
+        manager.load_configs(values_path=values_path, patterns_path=patterns_path)
+
+        values_path.write_text(yaml.dump({
+            **values_config,
+            "defaults": {**values_config["defaults"], "project": "otherproject"}
+        }))
+        manager.load_configs(values_path=values_path, patterns_path=patterns_path)
+
+        result = manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+        assert result.name == "otherproject-raw-raw-prd-use1"
+
     def test_load_from_default_locations_not_exist(self):
         """Test loading from default locations when files don't exist"""
         manager = ConfigurationManager()
@@ -191,10 +275,7 @@ class TestConfigurationManager:
     def test_generate_name_simple(self, values_config, patterns_config):
         """Test generating a simple name"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         result = manager.generate_name(
             resource_type="aws_s3_bucket",
@@ -209,10 +290,7 @@ class TestConfigurationManager:
     def test_generate_name_with_overrides(self, values_config, patterns_config):
         """Test generating name with value overrides"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         result = manager.generate_name(
             resource_type="aws_s3_bucket",
@@ -226,10 +304,7 @@ class TestConfigurationManager:
     def test_generate_name_with_blueprint_metadata(self, values_config, patterns_config):
         """Test generating name with blueprint metadata"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         result = manager.generate_name(
             resource_type="aws_s3_bucket",
@@ -240,6 +315,142 @@ class TestConfigurationManager:
         assert result.is_valid
         assert result.name == "testproject-raw-gold-prd-use1"
 
+    def test_base_values_merged_on_first_use(self, values_config, patterns_config):
+        """Test defaults, environment and resource-type values are merged per used pair"""
+        manager = ConfigurationManager()
+        manager.load_configs(
+            values_dict=values_config,
+            patterns_dict=patterns_config
+        )
+        assert manager._base_values == {}
+
+        manager.generate_name("aws_s3_bucket", environment=Environment.PRD.value)
+        with pytest.raises(PatternError):
+            manager.generate_name("dbx_cluster")  # pattern needs an environment
+        with pytest.raises(PatternError):
+            manager.generate_name("aws_s3_bucket", environment="unknown")
+
+        assert set(manager._base_values) == {
+            (Environment.PRD.value, "aws_s3_bucket"),
+            (None, "dbx_cluster"),
+        }
+        assert manager._base_values[(Environment.PRD.value, "aws_s3_bucket")] == {
+            "project": "testproject",
+            "region": "us-east-1",
+            "region_short": "use1",
+            "environment": Environment.PRD.value,
+            "purpose": "raw",
+            "layer": "raw"
+        }
+        assert "environment" not in manager._base_values[(None, "dbx_cluster")]
+
+    def test_base_values_rebuilt_after_direct_loader_reload(self, values_config, patterns_config):
+        """Test merged base values follow a loader reloaded outside load_configs"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        resources = [{"id": "bucket", "type": "aws_s3_bucket"}]
+        manager.generate_names_for_blueprint(resources, environment=Environment.PRD.value)
+
+        manager.values_loader.load_from_dict({
+            **values_config,
+            "resource_types": {"aws_s3_bucket": {"purpose": "curated", "layer": "gold"}}
+        })
+
+        results = manager.generate_names_for_blueprint(
+            resources, environment=Environment.PRD.value
+        )
+        assert results["bucket"].name == "testproject-curated-gold-prd-use1"
+        assert manager._base_values[(Environment.PRD.value, "aws_s3_bucket")]["layer"] == "gold"
+
+    def test_generate_name_memoized(self, values_config, patterns_config):
+        """Test repeated calls hit the memo but return independent results"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        first = manager.generate_name(
+            "aws_s3_bucket", Environment.PRD.value, blueprint_metadata={"layer": "gold"}
+        )
+        first.values_used["layer"] = "mutated"
+        second = manager.generate_name(
+            "aws_s3_bucket", Environment.PRD.value, blueprint_metadata={"layer": "gold"}
+        )
+
+        assert manager._generate_name_cached.cache_info().hits == 1
+        assert second == GeneratedName(
+            name="testproject-raw-gold-prd-use1",
+            resource_type="aws_s3_bucket",
+            pattern_used="{project}-{purpose}-{layer}-{environment}-{region_short}",
+            values_used={**second.values_used, "layer": "gold"},
+            validation_errors=[]
+        )
+
+    def test_generate_name_memo_cleared_on_reload(self, values_config, patterns_config):
+        """Test load_configs invalidates previously generated names"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+
+        reloaded_values = {
+            **values_config,
+            "defaults": {**values_config["defaults"], "project": "other"}
+        }
+        manager.load_configs(values_dict=reloaded_values, patterns_dict=patterns_config)
+
+        result = manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+        assert result.name == "other-raw-raw-prd-use1"
+
+    def test_generate_name_memo_cleared_on_failed_reload(self, values_config, patterns_config):
+        """Test a load_configs that fails after reloading values still invalidates the memo"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+
+        reloaded_values = {
+            **values_config,
+            "defaults": {**values_config["defaults"], "project": "other"}
+        }
+        with pytest.raises(ConfigurationError, match="patterns_path or patterns_dict"):
+            manager.load_configs(values_dict=reloaded_values)
+
+        result = manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+        assert result.name == "other-raw-raw-prd-use1"
+
+    def test_generate_name_memo_cleared_on_direct_loader_reload(
+        self, values_config, patterns_config
+    ):
+        """Test reloading a loader directly invalidates previously generated names"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+
+        manager.values_loader.load_from_dict({
+            **values_config,
+            "defaults": {**values_config["defaults"], "project": "other"}
+        })
+
+        result = manager.generate_name("aws_s3_bucket", Environment.PRD.value)
+        assert result.name == "other-raw-raw-prd-use1"
+
+    def test_generate_name_memo_keys_on_value_type(self, values_config, patterns_config):
+        """Test equal overrides of different types (1, 1.0, True) are not conflated"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        names = [
+            manager.generate_name(
+                "aws_s3_bucket",
+                Environment.PRD.value,
+                value_overrides={"layer": layer}  # type: ignore[dict-item]
+            ).name
+            for layer in (1, 1.0, True)
+        ]
+
+        assert names == [
+            "testproject-raw-1-prd-use1",
+            "testproject-raw-1.0-prd-use1",
+            "testproject-raw-True-prd-use1",
+        ]
+
     def test_generate_name_not_loaded(self):
         """Test generating name before loading configs"""
         manager = ConfigurationManager()
@@ -250,10 +461,7 @@ class TestConfigurationManager:
     def test_generate_name_invalid_resource_type(self, values_config, patterns_config):
         """Test generating name for non-existent resource type"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         with pytest.raises(PatternError, match="No pattern defined"):
             manager.generate_name("nonexistent_type")
@@ -261,10 +469,7 @@ class TestConfigurationManager:
     def test_generate_names_for_blueprint(self, values_config, patterns_config):
         """Test generating names for multiple resources"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         resources = [
             {
@@ -294,10 +499,7 @@ class TestConfigurationManager:
     def test_generate_names_for_blueprint_with_errors(self, values_config, patterns_config):
         """Test generating names when some resources have errors"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         resources = [
             {"id": "valid", "type": "aws_s3_bucket"},
@@ -314,18 +516,57 @@ class TestConfigurationManager:
         assert not results["invalid"].is_valid
         assert len(results["invalid"].validation_errors) > 0
 
+    def test_generate_names_for_blueprint_keeps_resource_order(
+        self, values_config, patterns_config
+    ):
+        """Test grouping by resource type doesn't reorder the results"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        resources = [
+            {"id": "bucket1", "type": "aws_s3_bucket"},
+            {"id": "catalog", "type": "dbx_catalog"},
+            {"id": "missing", "type": "nonexistent_type"},
+            {"id": "bucket2", "type": "aws_s3_bucket", "metadata": {"layer": "gold"}},
+        ]
+
+        results = manager.generate_names_for_blueprint(
+            resources=resources,
+            environment=Environment.DEV.value
+        )
+
+        assert list(results) == ["bucket1", "catalog", "missing", "bucket2"]
+        assert results["catalog"].name == "testproject_dev"
+        assert results["bucket2"].name == "testproject-raw-gold-dev-use1"
+        assert not results["missing"].is_valid
+
     def test_validate_configuration_valid(self, values_config, patterns_config):
         """Test configuration validation when valid"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         warnings = manager.validate_configuration()
         # May have warnings about other resource types missing variables
         assert isinstance(warnings, list)
 
+    def test_validate_configuration_defaults_cover_all(self, values_config, patterns_config):
+        """Test no warnings when defaults provide every referenced variable"""
+        values_config = {
+            **values_config,
+            "defaults": {
+                **values_config["defaults"],
+                "environment": Environment.DEV.value,
+                "purpose": "raw",
+                "layer": "raw",
+                "entity": "customers",
+                "domain": "sales"
+            }
+        }
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        assert manager.validate_configuration() == []
+
     def test_validate_configuration_missing_variables(self):
         """Test configuration validation with missing variables"""
         values_config = {
@@ -377,10 +618,7 @@ class TestConfigurationManager:
         }
 
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         warnings = manager.validate_configuration()
         assert len(warnings) > 0
@@ -389,10 +627,7 @@ class TestConfigurationManager:
     def test_get_available_resource_types(self, values_config, patterns_config):
         """Test getting available resource types"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         types = manager.get_available_resource_types()
         assert "aws_s3_bucket" in types
@@ -401,10 +636,7 @@ class TestConfigurationManager:
     def test_get_available_environments(self, values_config, patterns_config):
         """Test getting available environments"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         environments = manager.get_available_environments()
         assert Environment.DEV.value in environments
@@ -449,10 +681,7 @@ class TestConfigurationManager:
     def test_repr_loaded(self, values_config, patterns_config):
         """Test string representation when loaded"""
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         repr_str = repr(manager)
         assert "ConfigurationManager" in repr_str
@@ -461,6 +690,18 @@ class TestConfigurationManager:
         assert "resource_types=27" in repr_str
         assert "environments=2" in repr_str
 
+    def test_repr_refreshed_on_reload(self, values_config, patterns_config):
+        """Test the cached representation is rebuilt after load_configs"""
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+        assert "environments=2" in repr(manager)
+
+        manager.load_configs(
+            values_dict={**values_config, "environments": {"dev": {"environment": "dev"}}},
+            patterns_dict=patterns_config
+        )
+        assert "environments=1" in repr(manager)
+
     def test_check_loaded_values_not_loaded(self, patterns_config):
         """Test _check_loaded when values not loaded"""
         manager = ConfigurationManager()
@@ -482,14 +723,17 @@ class TestConfigurationManager:
     def test_integration_with_transformations(self, values_config, patterns_config):
         """Test full integration with transformations applied"""
         # Use valid lowercase values that will be transformed
-        values_config["defaults"]["project"] = "data-platform"
-        values_config["defaults"]["environment"] = Environment.PRD.value
+        values_config = {
+            **values_config,
+            "defaults": {
+                **values_config["defaults"],
+                "project": "data-platform",
+                "environment": Environment.PRD.value
+            }
+        }
 
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         # Test with value overrides that need transformation
         result = manager.generate_name(
@@ -502,6 +746,50 @@ class TestConfigurationManager:
         assert result.name.startswith("data-platform")
         assert Environment.PRD.value in result.name
 
+    def test_overrides_retransformed(self, values_config, patterns_config):
+        """Test overridden values are transformed on top of pre-transformed base values"""
+        transformations = patterns_config["transformations"]
+        patterns_config = {
+            **patterns_config,
+            "transformations": {
+                **transformations,
+                "region_mapping": {**transformations["region_mapping"], "us-west-2": "usw2"}
+            }
+        }
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        result = manager.generate_name(
+            resource_type="aws_s3_bucket",
+            environment=Environment.PRD.value,
+            value_overrides={"project": "Analytics", "region": "us-west-2"}
+        )
+
+        assert result.name == "analytics-raw-raw-prd-usw2"
+        assert result.values_used["region_short"] == "usw2"
+
+    def test_unmapped_region_override_drops_derived_region_short(
+        self, values_config, patterns_config
+    ):
+        """Test an unmapped region override doesn't reuse the base region's short code"""
+        defaults = {k: v for k, v in values_config["defaults"].items() if k != "region_short"}
+        values_config = {**values_config, "defaults": defaults}
+        manager = ConfigurationManager()
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
+
+        mapped = manager.generate_name(
+            resource_type="aws_s3_bucket",
+            environment=Environment.PRD.value
+        )
+        assert mapped.name == "testproject-raw-raw-prd-use1"
+
+        with pytest.raises(PatternError, match="region_short"):
+            manager.generate_name(
+                resource_type="aws_s3_bucket",
+                environment=Environment.PRD.value,
+                value_overrides={"region": "eu-west-9"}
+            )
+
     def test_validation_errors_in_generated_name(self):
         """Test that validation errors are captured in GeneratedName"""
         values_config = {
@@ -557,10 +845,7 @@ class TestConfigurationManager:
         }
 
         manager = ConfigurationManager()
-        manager.load_configs(
-            values_dict=values_config,
-            patterns_dict=patterns_config
-        )
+        manager.load_configs(values_dict=values_config, patterns_dict=patterns_config)
 
         result = manager.generate_name("aws_s3_bucket")
 
@@ -22,7 +22,7 @@ from data_platform_naming.exceptions import ValidationError
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dbx_config():
     """Standard Databricks naming config for tests"""
     return DatabricksNamingConfig(
@@ -34,7 +34,7 @@ def dbx_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dbx_config_minimal():
     """Minimal Databricks naming config without optional fields"""
     return DatabricksNamingConfig(
@@ -44,7 +44,7 @@ def dbx_config_minimal():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def values_config():
     """Values configuration for tests"""
     return {
@@ -122,7 +122,7 @@ def values_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def patterns_config():
     """Patterns configuration with all Databricks patterns"""
     return {
@@ -179,7 +179,7 @@ def patterns_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_manager(values_config, patterns_config):
     """ConfigurationManager loaded with test configs"""
     from data_platform_naming.config.naming_patterns_loader import NamingPatternsLoader
@@ -201,6 +201,15 @@ def config_manager(values_config, patterns_config):
     return manager
 
 
+@pytest.fixture(scope="module")
+def dbx_generator(dbx_config, config_manager):
+    """DatabricksNamingGenerator shared by the read-only generation tests"""
+    return DatabricksNamingGenerator(
+        config=dbx_config,
+        configuration_manager=config_manager
+    )
+
+
 # ============================================================================
 # Test DatabricksNamingGenerator Initialization
 # ============================================================================
@@ -217,6 +226,14 @@ class TestDatabricksNamingGeneratorInit:
 
         assert generator.config == dbx_config
         assert generator.configuration_manager is config_manager
+
+    def test_init_slots(self, dbx_generator, dbx_config):
+        """Test generator and config carry no per-instance __dict__"""
+        assert not hasattr(dbx_generator, "__dict__")
+        assert not hasattr(dbx_config, "__dict__")
+        with pytest.raises(AttributeError):
+            dbx_config.project = "other"  # type: ignore[misc]
+
     def test_init_validates_environment(self, config_manager):
         """Test that invalid environment raises ValidationError"""
         invalid_config = DatabricksNamingConfig(
@@ -275,28 +292,18 @@ class TestDatabricksNamingGeneratorInit:
 class TestDatabricksNamingGeneratorCluster:
     """Test Databricks cluster name generation"""
 
-    def test_generate_cluster_name_success(self, dbx_config, config_manager):
+    def test_generate_cluster_name_success(self, dbx_generator):
         """Test successful cluster name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_cluster_name(
+        name = dbx_generator.generate_cluster_name(
             workload="analytics",
             cluster_type="dedicated"
         )
 
         assert name == "testproject-analytics-dedicated-prd"
 
-    def test_generate_cluster_name_with_version(self, dbx_config, config_manager):
+    def test_generate_cluster_name_with_version(self, dbx_generator):
         """Test cluster name generation with version parameter"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_cluster_name(
+        name = dbx_generator.generate_cluster_name(
             workload="ml",
             cluster_type="shared",
             version="v2"
@@ -305,15 +312,10 @@ class TestDatabricksNamingGeneratorCluster:
         assert "prd" in name
         assert "ml" in name
 
-    def test_generate_cluster_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_cluster_name_with_metadata(self, dbx_generator):
         """Test cluster name generation with blueprint metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"cluster_type": "job"}
-        name = generator.generate_cluster_name(
+        name = dbx_generator.generate_cluster_name(
             workload="etl",
             cluster_type="shared",  # Should be overridden by metadata
             metadata=metadata
@@ -326,14 +328,9 @@ class TestDatabricksNamingGeneratorCluster:
 class TestDatabricksNamingGeneratorJob:
     """Test Databricks job name generation"""
 
-    def test_generate_job_name_with_schedule(self, dbx_config, config_manager):
+    def test_generate_job_name_with_schedule(self, dbx_generator):
         """Test successful job name generation with schedule"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_job_name(
+        name = dbx_generator.generate_job_name(
             job_type="batch",
             purpose="customer-load",
             schedule="hourly"
@@ -341,14 +338,9 @@ class TestDatabricksNamingGeneratorJob:
 
         assert name == "testproject-batch-customer-load-hourly-prd"
 
-    def test_generate_job_name_without_schedule(self, dbx_config, config_manager):
+    def test_generate_job_name_without_schedule(self, dbx_generator):
         """Test job name generation without schedule parameter"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_job_name(
+        name = dbx_generator.generate_job_name(
             job_type="streaming",
             purpose="events"
         )
@@ -357,15 +349,10 @@ class TestDatabricksNamingGeneratorJob:
         assert "events" in name
         assert "prd" in name
 
-    def test_generate_job_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_job_name_with_metadata(self, dbx_generator):
         """Test job name generation with blueprint metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"schedule": "daily"}
-        name = generator.generate_job_name(
+        name = dbx_generator.generate_job_name(
             job_type="batch",
             purpose="transform",
             metadata=metadata
@@ -379,26 +366,16 @@ class TestDatabricksNamingGeneratorUnityCatalog:
     """Test Unity Catalog resource name generation"""
 
     # Catalog tests
-    def test_generate_catalog_name_success(self, dbx_config, config_manager):
+    def test_generate_catalog_name_success(self, dbx_generator):
         """Test successful catalog name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_catalog_name(catalog_type="dev")
+        name = dbx_generator.generate_catalog_name(catalog_type="dev")
 
         assert name == "testproject_dev_prd"
 
-    def test_generate_catalog_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_catalog_name_with_metadata(self, dbx_generator):
         """Test catalog name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"catalog_type": "test"}
-        name = generator.generate_catalog_name(
+        name = dbx_generator.generate_catalog_name(
             catalog_type="main",
             metadata=metadata
         )
@@ -406,29 +383,19 @@ class TestDatabricksNamingGeneratorUnityCatalog:
         assert "prd" in name
         assert "testproject" in name
 
-    def test_generate_schema_name_success(self, dbx_config, config_manager):
+    def test_generate_schema_name_success(self, dbx_generator):
         """Test successful schema name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_schema_name(
+        name = dbx_generator.generate_schema_name(
             domain="sales",
             layer="silver"
         )
 
         assert name == "sales_silver"
 
-    def test_generate_schema_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_schema_name_with_metadata(self, dbx_generator):
         """Test schema name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"layer": "gold"}
-        name = generator.generate_schema_name(
+        name = dbx_generator.generate_schema_name(
             domain="finance",
             layer="bronze",
             metadata=metadata
@@ -436,29 +403,19 @@ class TestDatabricksNamingGeneratorUnityCatalog:
 
         assert "finance" in name
 
-    def test_generate_table_name_success(self, dbx_config, config_manager):
+    def test_generate_table_name_success(self, dbx_generator):
         """Test successful table name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_table_name(
+        name = dbx_generator.generate_table_name(
             entity="orders",
             table_type="fact"
         )
 
         assert name == "fact_orders"
 
-    def test_generate_table_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_table_name_with_metadata(self, dbx_generator):
         """Test table name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"table_type": "dim"}
-        name = generator.generate_table_name(
+        name = dbx_generator.generate_table_name(
             entity="customers",
             table_type="fact",
             metadata=metadata
@@ -466,27 +423,17 @@ class TestDatabricksNamingGeneratorUnityCatalog:
 
         assert "customers" in name
 
-    def test_generate_table_name_different_types(self, dbx_config, config_manager):
+    def test_generate_table_name_different_types(self, dbx_generator):
         """Test table name generation with different table types"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        dim_name = generator.generate_table_name(entity="products", table_type="dim")
-        fact_name = generator.generate_table_name(entity="sales", table_type="fact")
+        dim_name = dbx_generator.generate_table_name(entity="products", table_type="dim")
+        fact_name = dbx_generator.generate_table_name(entity="sales", table_type="fact")
 
         assert "dim" in dim_name
         assert "fact" in fact_name
 
-    def test_generate_full_table_reference(self, dbx_config, config_manager):
+    def test_generate_full_table_reference(self, dbx_generator):
         """Test full Unity Catalog table reference generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        ref = generator.generate_full_table_reference(
+        ref = dbx_generator.generate_full_table_reference(
             catalog_type="main",
             domain="finance",
             layer="gold",
@@ -496,14 +443,9 @@ class TestDatabricksNamingGeneratorUnityCatalog:
 
         assert ref == "testproject_main_prd.finance_gold.dim_customers"
 
-    def test_full_table_reference_format(self, dbx_config, config_manager):
+    def test_full_table_reference_format(self, dbx_generator):
         """Test that full table reference has correct 3-tier format"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        ref = generator.generate_full_table_reference(
+        ref = dbx_generator.generate_full_table_reference(
             catalog_type="dev",
             domain="sales",
             layer="silver",
@@ -511,21 +453,14 @@ class TestDatabricksNamingGeneratorUnityCatalog:
             table_type="fact"
         )
 
-        # Should have exactly 2 dots (3 parts)
-        assert ref.count('.') == 2
-        parts = ref.split('.')
-        assert len(parts) == 3
+        # catalog.schema.table
+        assert ref.split('.') == ["testproject_dev_prd", "sales_silver", "fact_orders"]
 
-    def test_unity_catalog_3tier_namespace(self, dbx_config, config_manager):
+    def test_unity_catalog_3tier_namespace(self, dbx_generator):
         """Test Unity Catalog 3-tier namespace structure"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        catalog = generator.generate_catalog_name("main")
-        schema = generator.generate_schema_name("finance", "gold")
-        table = generator.generate_table_name("customers", "dim")
+        catalog = dbx_generator.generate_catalog_name("main")
+        schema = dbx_generator.generate_schema_name("finance", "gold")
+        table = dbx_generator.generate_table_name("customers", "dim")
 
         # All should use underscores (Unity Catalog requirement)
         assert "_" in catalog
@@ -540,38 +475,22 @@ class TestDatabricksNamingGeneratorUnityCatalog:
 class TestDatabricksNamingGeneratorWorkspace:
     """Test Databricks workspace name generation"""
 
-    def test_generate_workspace_name_success(self, dbx_config, config_manager):
+    def test_generate_workspace_name_success(self, dbx_generator):
         """Test successful workspace name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_workspace_name(purpose="analytics")
+        name = dbx_generator.generate_workspace_name(purpose="analytics")
 
-        assert "prd" in name
-        assert "testproject" in name or "analytics" in name
+        assert name == "dbx-testproject-analytics-prd-use1"
 
-    def test_generate_workspace_name_default_purpose(self, dbx_config, config_manager):
+    def test_generate_workspace_name_default_purpose(self, dbx_generator):
         """Test workspace name generation with default purpose"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_workspace_name()
+        name = dbx_generator.generate_workspace_name()
 
         assert "prd" in name
 
-    def test_generate_workspace_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_workspace_name_with_metadata(self, dbx_generator):
         """Test workspace name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"purpose": "ml"}
-        name = generator.generate_workspace_name(purpose="analytics", metadata=metadata)
+        name = dbx_generator.generate_workspace_name(purpose="analytics", metadata=metadata)
 
         assert "prd" in name
 
@@ -579,38 +498,23 @@ class TestDatabricksNamingGeneratorWorkspace:
 class TestDatabricksNamingGeneratorSQLWarehouse:
     """Test Databricks SQL warehouse name generation"""
 
-    def test_generate_sql_warehouse_name_success(self, dbx_config, config_manager):
+    def test_generate_sql_warehouse_name_success(self, dbx_generator):
         """Test successful SQL warehouse name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_sql_warehouse_name(size="large", purpose="reporting")
+        name = dbx_generator.generate_sql_warehouse_name(size="large", purpose="reporting")
 
         assert "prd" in name
         assert "sql" in name or "reporting" in name or "large" in name
 
-    def test_generate_sql_warehouse_name_defaults(self, dbx_config, config_manager):
+    def test_generate_sql_warehouse_name_defaults(self, dbx_generator):
         """Test SQL warehouse name generation with default parameters"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_sql_warehouse_name()
+        name = dbx_generator.generate_sql_warehouse_name()
 
         assert "prd" in name
 
-    def test_generate_sql_warehouse_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_sql_warehouse_name_with_metadata(self, dbx_generator):
         """Test SQL warehouse name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"size": "xlarge"}
-        name = generator.generate_sql_warehouse_name(
+        name = dbx_generator.generate_sql_warehouse_name(
             size="medium",
             purpose="analytics",
             metadata=metadata
@@ -618,15 +522,10 @@ class TestDatabricksNamingGeneratorSQLWarehouse:
 
         assert "prd" in name
 
-    def test_generate_sql_warehouse_name_different_sizes(self, dbx_config, config_manager):
+    def test_generate_sql_warehouse_name_different_sizes(self, dbx_generator):
         """Test SQL warehouse names with different sizes"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        small = generator.generate_sql_warehouse_name(size="small", purpose="adhoc")
-        large = generator.generate_sql_warehouse_name(size="large", purpose="analytics")
+        small = dbx_generator.generate_sql_warehouse_name(size="small", purpose="adhoc")
+        large = dbx_generator.generate_sql_warehouse_name(size="large", purpose="analytics")
 
         assert "prd" in small
         assert "prd" in large
@@ -635,14 +534,9 @@ class TestDatabricksNamingGeneratorSQLWarehouse:
 class TestDatabricksNamingGeneratorPipeline:
     """Test Databricks Delta Live Tables pipeline name generation"""
 
-    def test_generate_pipeline_name_success(self, dbx_config, config_manager):
+    def test_generate_pipeline_name_success(self, dbx_generator):
         """Test successful pipeline name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_pipeline_name(
+        name = dbx_generator.generate_pipeline_name(
             source="s3",
             target="bronze",
             pipeline_type="dlt"
@@ -651,26 +545,16 @@ class TestDatabricksNamingGeneratorPipeline:
         assert "prd" in name
         assert "s3" in name or "bronze" in name or "dlt" in name
 
-    def test_generate_pipeline_name_default_type(self, dbx_config, config_manager):
+    def test_generate_pipeline_name_default_type(self, dbx_generator):
         """Test pipeline name generation with default type"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_pipeline_name(source="kafka", target="events")
+        name = dbx_generator.generate_pipeline_name(source="kafka", target="events")
 
         assert "prd" in name
 
-    def test_generate_pipeline_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_pipeline_name_with_metadata(self, dbx_generator):
         """Test pipeline name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"pipeline_type": "streaming"}
-        name = generator.generate_pipeline_name(
+        name = dbx_generator.generate_pipeline_name(
             source="kinesis",
             target="realtime",
             metadata=metadata
@@ -682,14 +566,9 @@ class TestDatabricksNamingGeneratorPipeline:
 class TestDatabricksNamingGeneratorNotebook:
     """Test Databricks notebook path generation"""
 
-    def test_generate_notebook_path_success(self, dbx_config, config_manager):
+    def test_generate_notebook_path_success(self, dbx_generator):
         """Test successful notebook path generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        path = generator.generate_notebook_path(
+        path = dbx_generator.generate_notebook_path(
             domain="finance",
             purpose="etl",
             notebook_name="load-customers"
@@ -699,15 +578,10 @@ class TestDatabricksNamingGeneratorNotebook:
         assert "finance" in path
         assert "load-customers" in path
 
-    def test_generate_notebook_path_with_metadata(self, dbx_config, config_manager):
+    def test_generate_notebook_path_with_metadata(self, dbx_generator):
         """Test notebook path generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"domain": "marketing"}
-        path = generator.generate_notebook_path(
+        path = dbx_generator.generate_notebook_path(
             domain="finance",
             purpose="analysis",
             notebook_name="report",
@@ -720,27 +594,17 @@ class TestDatabricksNamingGeneratorNotebook:
 class TestDatabricksNamingGeneratorRepo:
     """Test Databricks Git repo name generation"""
 
-    def test_generate_repo_name_success(self, dbx_config, config_manager):
+    def test_generate_repo_name_success(self, dbx_generator):
         """Test successful repo name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_repo_name(repo_purpose="notebooks")
+        name = dbx_generator.generate_repo_name(repo_purpose="notebooks")
 
         assert "prd" in name
         assert "notebooks" in name or "testproject" in name
 
-    def test_generate_repo_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_repo_name_with_metadata(self, dbx_generator):
         """Test repo name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"repo_purpose": "pipelines"}
-        name = generator.generate_repo_name(repo_purpose="code", metadata=metadata)
+        name = dbx_generator.generate_repo_name(repo_purpose="code", metadata=metadata)
 
         assert "prd" in name
 
@@ -748,38 +612,23 @@ class TestDatabricksNamingGeneratorRepo:
 class TestDatabricksNamingGeneratorVolume:
     """Test Unity Catalog volume name generation"""
 
-    def test_generate_volume_name_success(self, dbx_config, config_manager):
+    def test_generate_volume_name_success(self, dbx_generator):
         """Test successful volume name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_volume_name(purpose="uploads", data_type="raw")
+        name = dbx_generator.generate_volume_name(purpose="uploads", data_type="raw")
 
         assert "_" in name  # Volume uses underscores
         assert "raw" in name or "uploads" in name
 
-    def test_generate_volume_name_defaults(self, dbx_config, config_manager):
+    def test_generate_volume_name_defaults(self, dbx_generator):
         """Test volume name generation with default data_type"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_volume_name(purpose="landing")
+        name = dbx_generator.generate_volume_name(purpose="landing")
 
         assert "_" in name
 
-    def test_generate_volume_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_volume_name_with_metadata(self, dbx_generator):
         """Test volume name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"data_type": "processed"}
-        name = generator.generate_volume_name(purpose="archive", metadata=metadata)
+        name = dbx_generator.generate_volume_name(purpose="archive", metadata=metadata)
 
         assert "_" in name
 
@@ -787,38 +636,23 @@ class TestDatabricksNamingGeneratorVolume:
 class TestDatabricksNamingGeneratorSecretScope:
     """Test Databricks secret scope name generation"""
 
-    def test_generate_secret_scope_name_success(self, dbx_config, config_manager):
+    def test_generate_secret_scope_name_success(self, dbx_generator):
         """Test successful secret scope name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_secret_scope_name(purpose="azure")
+        name = dbx_generator.generate_secret_scope_name(purpose="azure")
 
         assert "prd" in name
         assert "azure" in name or "testproject" in name
 
-    def test_generate_secret_scope_name_defaults(self, dbx_config, config_manager):
+    def test_generate_secret_scope_name_defaults(self, dbx_generator):
         """Test secret scope name generation with default purpose"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_secret_scope_name()
+        name = dbx_generator.generate_secret_scope_name()
 
         assert "prd" in name
 
-    def test_generate_secret_scope_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_secret_scope_name_with_metadata(self, dbx_generator):
         """Test secret scope name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"purpose": "prod-keys"}
-        name = generator.generate_secret_scope_name(purpose="dev-keys", metadata=metadata)
+        name = dbx_generator.generate_secret_scope_name(purpose="dev-keys", metadata=metadata)
 
         assert "prd" in name
 
@@ -826,38 +660,23 @@ class TestDatabricksNamingGeneratorSecretScope:
 class TestDatabricksNamingGeneratorInstancePool:
     """Test Databricks instance pool name generation"""
 
-    def test_generate_instance_pool_name_success(self, dbx_config, config_manager):
+    def test_generate_instance_pool_name_success(self, dbx_generator):
         """Test successful instance pool name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_instance_pool_name(node_type="compute", purpose="ml")
+        name = dbx_generator.generate_instance_pool_name(node_type="compute", purpose="ml")
 
         assert "prd" in name
         assert "pool" in name or "compute" in name or "ml" in name
 
-    def test_generate_instance_pool_name_defaults(self, dbx_config, config_manager):
+    def test_generate_instance_pool_name_defaults(self, dbx_generator):
         """Test instance pool name generation with default purpose"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_instance_pool_name(node_type="memory")
+        name = dbx_generator.generate_instance_pool_name(node_type="memory")
 
         assert "prd" in name
 
-    def test_generate_instance_pool_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_instance_pool_name_with_metadata(self, dbx_generator):
         """Test instance pool name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"purpose": "analytics"}
-        name = generator.generate_instance_pool_name(
+        name = dbx_generator.generate_instance_pool_name(
             node_type="compute",
             purpose="etl",
             metadata=metadata
@@ -869,38 +688,23 @@ class TestDatabricksNamingGeneratorInstancePool:
 class TestDatabricksNamingGeneratorPolicy:
     """Test Databricks policy name generation"""
 
-    def test_generate_policy_name_success(self, dbx_config, config_manager):
+    def test_generate_policy_name_success(self, dbx_generator):
         """Test successful policy name generation"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_policy_name(policy_type="cost", target="sql")
+        name = dbx_generator.generate_policy_name(policy_type="cost", target="sql")
 
         assert "prd" in name
         assert "cost" in name or "sql" in name
 
-    def test_generate_policy_name_defaults(self, dbx_config, config_manager):
+    def test_generate_policy_name_defaults(self, dbx_generator):
         """Test policy name generation with default target"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
-        name = generator.generate_policy_name(policy_type="security")
+        name = dbx_generator.generate_policy_name(policy_type="security")
 
         assert "prd" in name
 
-    def test_generate_policy_name_with_metadata(self, dbx_config, config_manager):
+    def test_generate_policy_name_with_metadata(self, dbx_generator):
         """Test policy name generation with metadata"""
-        generator = DatabricksNamingGenerator(
-            config=dbx_config,
-            configuration_manager=config_manager
-        )
-
         metadata = {"target": "job"}
-        name = generator.generate_policy_name(
+        name = dbx_generator.generate_policy_name(
             policy_type="performance",
             target="cluster",
             metadata=metadata
@@ -912,11 +716,9 @@ class TestDatabricksNamingGeneratorPolicy:
 class TestDatabricksNamingGeneratorUtilities:
     """Test utility functions like tags generation"""
 
-    def test_generate_standard_tags(self, dbx_config, config_manager):
+    def test_generate_standard_tags(self, dbx_generator):
         """Test standard tags generation"""
-        generator = DatabricksNamingGenerator(config=dbx_config, configuration_manager=config_manager)
-
-        tags = generator.generate_standard_tags(DatabricksResourceType.CLUSTER)
+        tags = dbx_generator.generate_standard_tags(DatabricksResourceType.CLUSTER)
 
         assert tags["Environment"] == "prd"
         assert tags["Project"] == "testproject"
@@ -936,12 +738,10 @@ class TestDatabricksNamingGeneratorUtilities:
         assert "Team" not in tags  # Not provided in minimal config
         assert "CostCenter" not in tags
 
-    def test_generate_standard_tags_with_additional(self, dbx_config, config_manager):
+    def test_generate_standard_tags_with_additional(self, dbx_generator):
         """Test standard tags with additional custom tags"""
-        generator = DatabricksNamingGenerator(config=dbx_config, configuration_manager=config_manager)
-
         additional = {"Owner": "data-team", "Critical": "true"}
-        tags = generator.generate_standard_tags(
+        tags = dbx_generator.generate_standard_tags(
             DatabricksResourceType.WORKSPACE,
             additional_tags=additional
         )
@@ -950,6 +750,20 @@ class TestDatabricksNamingGeneratorUtilities:
         assert tags["Critical"] == "true"
         assert tags["Environment"] == "prd"
 
+    def test_generate_standard_tags_returns_fresh_dict(self, dbx_generator):
+        """Test additional tags don't leak into later calls for the same type"""
+        first = dbx_generator.generate_standard_tags(
+            DatabricksResourceType.VOLUME,
+            additional_tags={"Owner": "data-team"}
+        )
+        first["Mutated"] = "yes"
+
+        second = dbx_generator.generate_standard_tags(DatabricksResourceType.VOLUME)
+
+        assert "Owner" not in second
+        assert "Mutated" not in second
+        assert second["ResourceType"] == DatabricksResourceType.VOLUME.value
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
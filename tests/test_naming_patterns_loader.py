@@ -85,6 +85,54 @@ class TestNamingPattern:
         with pytest.raises(PatternError, match="Missing required variables"):
             pattern.format(values)
 
+    @pytest.mark.parametrize("pattern_str", ["{entity}", "{project}-{entity}-{region}"])
+    def test_format_missing_variables_lists_all(self, pattern_str):
+        """Test the missing-variable error names every missing variable"""
+        pattern = NamingPattern(
+            pattern=pattern_str,
+            resource_type="test",
+            required_variables=[]
+        )
+
+        with pytest.raises(PatternError) as exc_info:
+            pattern.format({"project": "myproject"})
+
+        missing = sorted(set(pattern.get_variables()) - {"project"})
+        assert str(exc_info.value).endswith(": " + ", ".join(missing))
+
+    @pytest.mark.parametrize("pattern_str,expected", [
+        ("{entity}", "customers"),
+        ("tbl_{entity}", "tbl_customers"),
+        ("static-name", "static-name"),
+        ("{{1}}-{entity}", "{1}-customers"),
+        ("{entity}-{entity}", "customers-customers"),
+    ])
+    def test_format_fast_path_matches_str_format(self, pattern_str, expected):
+        """Test constant and single-placeholder patterns format like str.format"""
+        pattern = NamingPattern(
+            pattern=pattern_str,
+            resource_type="test",
+            required_variables=[]
+        )
+        assert pattern.format({"entity": "customers"}) == expected
+
+    @pytest.mark.parametrize("pattern_str", ["{entity}", "tbl_{entity}", "{entity}-{entity}"])
+    def test_format_uses_dunder_format_like_format_map(self, pattern_str):
+        """Test the fast path renders values with format(), as format_map does"""
+        class Entity:
+            def __str__(self):
+                return "str-form"
+
+            def __format__(self, spec):
+                return "customers"
+
+        pattern = NamingPattern(
+            pattern=pattern_str,
+            resource_type="test",
+            required_variables=[]
+        )
+        assert pattern.format({"entity": Entity()}) == pattern_str.format(entity="customers")
+
 
 class TestNamingPatternsLoader:
     """Test NamingPatternsLoader class"""
@@ -300,6 +348,35 @@ class TestNamingPatternsLoader:
         assert pattern.resource_type == "aws_s3_bucket"
         assert "project" in pattern.required_variables
 
+    def test_get_pattern_variables_extracted_at_load(self, valid_config):
+        """Test pattern variables come from the index built at load time"""
+        loader = NamingPatternsLoader()
+        loader.load_from_dict(valid_config)
+
+        pattern = loader.get_pattern("aws_s3_bucket")
+        assert pattern.variables == (
+            "project", "purpose", "layer", "environment", "region_short"
+        )
+
+    def test_failed_reload_keeps_previous_patterns(self, valid_config):
+        """Test a reload that fails validation leaves the loaded patterns usable"""
+        loader = NamingPatternsLoader()
+        loader.load_from_dict(valid_config)
+
+        invalid_config = {
+            **valid_config,
+            "version": "2.0",
+            "patterns": {**valid_config["patterns"], "dbx_table": "{name}"}
+        }
+        with pytest.raises(SchemaValidationError):
+            loader.load_from_dict(invalid_config)
+
+        pattern = loader.get_pattern("dbx_table")
+        assert pattern.pattern == "{table_type}_{entity}"
+        assert pattern.variables == ("table_type", "entity")
+        assert pattern.format({"table_type": "fact", "entity": "orders"}) == "fact_orders"
+        assert loader.get_version() == "1.0"
+
     def test_get_pattern_not_found(self, valid_config):
         """Test getting a pattern that doesn't exist"""
         loader = NamingPatternsLoader()
@@ -417,6 +494,16 @@ class TestNamingPatternsLoader:
         # Unknown type returns empty list
         assert loader.get_required_variables("unknown_type") == []
 
+    def test_get_required_variables_returns_copy(self, valid_config):
+        """Test mutating the returned list leaves the loaded rules untouched"""
+        loader = NamingPatternsLoader()
+        loader.load_from_dict(valid_config)
+
+        loader.get_required_variables("aws_s3_bucket").append("extra")
+
+        assert "extra" not in loader.get_required_variables("aws_s3_bucket")
+        assert "extra" not in valid_config["validation"]["required_variables"]["aws_s3_bucket"]
+
     def test_validate_name_valid(self, valid_config):
         """Test name validation for valid name"""
         loader = NamingPatternsLoader()
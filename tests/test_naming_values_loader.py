@@ -3,6 +3,7 @@
 Tests for NamingValuesLoader class.
 """
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -10,6 +11,7 @@ import pytest
 import yaml
 
 from data_platform_naming.config.naming_values_loader import (
+    _VALIDATOR_CACHE,
     ConfigurationError,
     FileLoadError,
     NamingValues,
@@ -129,6 +131,20 @@ class TestNamingValuesLoader:
         loader = NamingValuesLoader(schema_path=schema_path)
         assert loader.schema is not None
 
+    def test_init_rereads_changed_schema(self, tmp_path, valid_config):
+        """Test a loader picks up edits to a schema file parsed by an earlier loader"""
+        source = Path(__file__).parent.parent / "schemas" / "naming-values-schema.json"
+        schema = json.loads(source.read_text())
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(schema))
+        NamingValuesLoader(schema_path=schema_path).load_from_dict(valid_config)
+
+        schema["required"] = [*schema["required"], "environments"]
+        schema_path.write_text(json.dumps(schema, indent=2))
+        loader = NamingValuesLoader(schema_path=schema_path)
+        with pytest.raises(SchemaValidationError, match="environments"):
+            loader.load_from_dict({"version": "1.0", "defaults": valid_config["defaults"]})
+
     def test_load_from_dict_valid(self, valid_config):
         """Test loading valid configuration from dict"""
         loader = NamingValuesLoader()
@@ -159,6 +175,18 @@ class TestNamingValuesLoader:
         with pytest.raises(SchemaValidationError):
             loader.load_from_dict(invalid_config)
 
+    def test_schema_validator_reused_across_loaders(self, valid_config):
+        """Test loaders with the same schema share one checked validator"""
+        NamingValuesLoader().load_from_dict(valid_config)
+        cached = len(_VALIDATOR_CACHE)
+
+        loader = NamingValuesLoader()
+        loader.load_from_dict(valid_config)
+        with pytest.raises(SchemaValidationError, match="version"):
+            loader.load_from_dict({**valid_config, "version": "2.0"})
+
+        assert len(_VALIDATOR_CACHE) == cached
+
     def test_load_from_file_valid(self, temp_yaml_file):
         """Test loading valid configuration from file"""
         loader = NamingValuesLoader()
@@ -167,6 +195,22 @@ class TestNamingValuesLoader:
         assert loader.config is not None
         assert loader.config_path == temp_yaml_file
 
+    def test_load_from_file_reuses_unchanged_parse(self, temp_yaml_file, valid_config):
+        """Test cached parses are copied per loader and a modified file is re-parsed"""
+        first = NamingValuesLoader()
+        first.load_from_file(temp_yaml_file)
+        first.config["defaults"]["project"] = "mutated"
+        second = NamingValuesLoader()
+        second.load_from_file(temp_yaml_file)
+        assert second.config == valid_config
+        assert second.config is not first.config
+
+        valid_config = {**valid_config, "defaults": {"project": "changed-project"}}
+        temp_yaml_file.write_text(yaml.dump(valid_config))
+        third = NamingValuesLoader()
+        third.load_from_file(temp_yaml_file)
+        assert third.config["defaults"]["project"] == "changed-project"
+
     def test_load_from_file_not_found(self):
         """Test loading from non-existent file"""
         loader = NamingValuesLoader()
@@ -0,0 +1,36 @@
+"""
+Unit tests for the config init resource type selection parser.
+
+Kept apart from the CLI invocation tests so this pure, microsecond-scale
+table can run in a light shard, e.g.:
+
+    pytest tests/test_resource_type_selection_parser.py --assert=plain -p no:cacheprovider
+"""
+
+import pytest
+
+from data_platform_naming.cli import _parse_resource_type_selection
+
+
+class TestResourceTypeSelectionParser:
+    """Test the resource type selection parser."""
+
+    @pytest.mark.parametrize("selection,types,expected", [
+        # 'all' selection
+        ("all", ["aws_s3_bucket", "aws_glue_database", "dbx_catalog"],
+         ["aws_s3_bucket", "aws_glue_database", "dbx_catalog"]),
+        # Single numbers
+        ("1,3", ["aws_s3_bucket", "aws_glue_database", "dbx_catalog"],
+         ["aws_s3_bucket", "dbx_catalog"]),
+        # Range
+        ("2-4", [f"type{i}" for i in range(1, 6)], ["type2", "type3", "type4"]),
+        # Mixed
+        ("1,3-4,5", [f"type{i}" for i in range(1, 6)], ["type1", "type3", "type4", "type5"]),
+        # Out-of-range numbers are ignored
+        ("1,5,10", ["type1", "type2", "type3"], ["type1"]),
+        # Empty selection returns empty list
+        ("", ["type1", "type2", "type3"], []),
+    ], ids=["all", "single_numbers", "range", "mixed", "invalid_numbers_ignored", "empty"])
+    def test_parse_selection(self, selection, types, expected):
+        """Test selection strings map to the expected resource types."""
+        assert _parse_resource_type_selection(selection, types) == expected